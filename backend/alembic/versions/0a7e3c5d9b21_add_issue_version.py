@@ -0,0 +1,31 @@
+"""add issue version for optimistic concurrency
+
+Revision ID: 0a7e3c5d9b21
+Revises: f2c84d7a1e59
+Create Date: 2025-07-21 10:31:57.402118
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a7e3c5d9b21"
+down_revision: Union[str, Sequence[str], None] = "f2c84d7a1e59"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "issues",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("issues", "version")
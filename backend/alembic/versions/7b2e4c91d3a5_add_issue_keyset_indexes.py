@@ -0,0 +1,41 @@
+"""add issue keyset pagination indexes
+
+Revision ID: 7b2e4c91d3a5
+Revises: c4dec56e0d28
+Create Date: 2025-07-12 10:14:32.518204
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e4c91d3a5"
+down_revision: Union[str, Sequence[str], None] = "c4dec56e0d28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_issues_created_at_id", "issues", ["created_at", "id"])
+    op.create_index(
+        "ix_issues_status_created_at_id", "issues", ["status", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_issues_severity_created_at_id", "issues", ["severity", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_issues_reporter_id_created_at_id",
+        "issues",
+        ["reporter_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_issues_reporter_id_created_at_id", table_name="issues")
+    op.drop_index("ix_issues_severity_created_at_id", table_name="issues")
+    op.drop_index("ix_issues_status_created_at_id", table_name="issues")
+    op.drop_index("ix_issues_created_at_id", table_name="issues")
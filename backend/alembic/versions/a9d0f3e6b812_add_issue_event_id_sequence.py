@@ -0,0 +1,29 @@
+"""add issue event id sequence
+
+Revision ID: a9d0f3e6b812
+Revises: 7b2e4c91d3a5
+Create Date: 2025-07-13 16:02:47.103955
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9d0f3e6b812"
+down_revision: Union[str, Sequence[str], None] = "7b2e4c91d3a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Shared source of SSE event ids (see core.pubsub.notify_issue_event)
+    op.execute(sa.schema.CreateSequence(sa.Sequence("issue_event_id_seq")))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.schema.DropSequence(sa.Sequence("issue_event_id_seq")))
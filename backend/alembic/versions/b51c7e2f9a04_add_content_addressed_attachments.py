@@ -0,0 +1,49 @@
+"""add content-addressed attachments
+
+Revision ID: b51c7e2f9a04
+Revises: a9d0f3e6b812
+Create Date: 2025-07-15 11:37:20.841562
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b51c7e2f9a04"
+down_revision: Union[str, Sequence[str], None] = "a9d0f3e6b812"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "attachments",
+        sa.Column("sha256", sa.String(length=64), primary_key=True),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.add_column("issues", sa.Column("file_name", sa.String(), nullable=True))
+    op.add_column(
+        "issues", sa.Column("attachment_sha256", sa.String(length=64), nullable=True)
+    )
+    op.create_foreign_key(
+        "issues_attachment_sha256_fkey",
+        "issues",
+        "attachments",
+        ["attachment_sha256"],
+        ["sha256"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("issues_attachment_sha256_fkey", "issues", type_="foreignkey")
+    op.drop_column("issues", "attachment_sha256")
+    op.drop_column("issues", "file_name")
+    op.drop_table("attachments")
@@ -0,0 +1,37 @@
+"""add issue_status_counts table
+
+Revision ID: d3f8a1c62b7e
+Revises: b51c7e2f9a04
+Create Date: 2025-07-16 09:22:41.307915
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f8a1c62b7e"
+down_revision: Union[str, Sequence[str], None] = "b51c7e2f9a04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "issue_status_counts",
+        sa.Column("status", sa.String(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    # Seed the running counters from the existing issues
+    op.execute(
+        "INSERT INTO issue_status_counts (status, count) "
+        "SELECT status::text, count(*) FROM issues GROUP BY status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("issue_status_counts")
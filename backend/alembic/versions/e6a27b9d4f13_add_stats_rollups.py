@@ -0,0 +1,49 @@
+"""add severity counters and stats rollups
+
+Revision ID: e6a27b9d4f13
+Revises: d3f8a1c62b7e
+Create Date: 2025-07-17 14:05:12.660431
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a27b9d4f13"
+down_revision: Union[str, Sequence[str], None] = "d3f8a1c62b7e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "issue_severity_counts",
+        sa.Column("severity", sa.String(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO issue_severity_counts (severity, count) "
+        "SELECT severity::text, count(*) FROM issues GROUP BY severity"
+    )
+    op.create_table(
+        "stats_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("period", sa.String(), nullable=False),
+        sa.Column("dimension", sa.String(), nullable=False),
+        sa.Column("bucket", sa.Date(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.UniqueConstraint(
+            "period", "dimension", "bucket", "value", name="uix_stats_rollup_bucket"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("stats_rollups")
+    op.drop_table("issue_severity_counts")
@@ -0,0 +1,48 @@
+"""add issue full-text search vector
+
+Revision ID: f2c84d7a1e59
+Revises: e6a27b9d4f13
+Create Date: 2025-07-19 16:48:03.215977
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c84d7a1e59"
+down_revision: Union[str, Sequence[str], None] = "e6a27b9d4f13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "issues",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_issues_search_vector",
+        "issues",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_issues_search_vector", table_name="issues")
+    op.drop_column("issues", "search_vector")
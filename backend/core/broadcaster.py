@@ -0,0 +1,151 @@
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Any, List, Optional, Set, Tuple
+
+import orjson
+
+from core.config import SSE_OVERFLOW_POLICY, SSE_QUEUE_SIZE, SSE_REPLAY_SIZE
+from monitoring.metrics import (
+    SSE_EVENTS_DROPPED,
+    SSE_EVENTS_PUBLISHED,
+    SSE_MAX_QUEUE_DEPTH,
+    SSE_QUEUED_EVENTS,
+    SSE_REPLAYS,
+    SSE_SUBSCRIBERS,
+    sample_gauge,
+)
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+
+class SubscriptionClosed(Exception):
+    """Raised to a consumer that was cut off for falling too far behind."""
+
+
+class Subscription:
+    """
+    A single SSE client's bounded ring buffer. Publishing never blocks: when the
+    buffer is full the oldest event is dropped, or the subscription is closed,
+    depending on the overflow policy.
+    """
+
+    def __init__(self, maxsize: int, policy: str):
+        self.policy = policy
+        self.closed = False
+        # Set when a reconnecting client asked to resume from an event that is
+        # no longer in the replay log and must reload its state instead
+        self.needs_reset = False
+        self._buffer: deque = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def push(self, message: Any) -> None:
+        if self.closed:
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            if self.policy == DISCONNECT:
+                SSE_EVENTS_DROPPED.labels(reason="disconnect").inc(len(self._buffer))
+                self._buffer.clear()
+                self.close()
+                return
+            SSE_EVENTS_DROPPED.labels(reason="overflow").inc()
+        self._buffer.append(message)
+        self._ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def get(self) -> Any:
+        while not self._buffer:
+            if self.closed:
+                raise SubscriptionClosed()
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buffer.popleft()
+
+
+def sse_frame(event_id: int, data: Any) -> bytes:
+    """Encodes one event as a Server-Sent Events message."""
+    return b"id: %d\ndata: %s\n\n" % (event_id, orjson.dumps(data))
+
+
+class Broadcaster:
+    """
+    Process-local fan-out of issue events to SSE subscribers. Events are
+    `{"id": ..., "data": ...}` dicts; each is encoded once and queued to every
+    subscriber as an `(id, frame)` tuple, and the most recent ones are kept so
+    reconnecting clients can resume. `publish` must be called from the event
+    loop thread.
+    """
+
+    def __init__(self, queue_size: int, policy: str, replay_size: int):
+        if policy not in (DROP_OLDEST, DISCONNECT):
+            raise RuntimeError(f"Unknown SSE overflow policy: {policy}")
+        self.queue_size = queue_size
+        self.policy = policy
+        self._subscriptions: Set[Subscription] = set()
+        self._history: deque = deque(maxlen=replay_size)
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscription:
+        subscription = Subscription(self.queue_size, self.policy)
+        if last_event_id is not None:
+            missed = self._events_after(last_event_id)
+            if missed is None or len(missed) > self.queue_size:
+                subscription.needs_reset = True
+                SSE_REPLAYS.labels(outcome="reset").inc()
+            else:
+                for event in missed:
+                    subscription.push(event)
+                SSE_REPLAYS.labels(outcome="replayed").inc()
+        self._subscriptions.add(subscription)
+        SSE_SUBSCRIBERS.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            subscription.close()
+            SSE_SUBSCRIBERS.dec()
+
+    def publish(self, event: dict) -> None:
+        entry = (event["id"], sse_frame(event["id"], event["data"]))
+        self._history.append(entry)
+        SSE_EVENTS_PUBLISHED.inc()
+        for subscription in self._subscriptions:
+            subscription.push(entry)
+
+    def _events_after(self, event_id: int) -> Optional[List[Tuple[int, Any]]]:
+        """
+        Returns the logged events that followed `event_id`, or None when that
+        event has already been evicted (or was never seen by this process).
+        """
+        for index, (logged_id, _) in enumerate(self._history):
+            if logged_id == event_id:
+                return list(islice(self._history, index + 1, None))
+        return None
+
+    def queued_events(self) -> int:
+        """
+        Gauge callback, run on whichever thread serves /metrics while the event
+        loop adds and removes subscriptions. Iterates a copy of the set, which
+        list() takes atomically, so a concurrent resize cannot break it.
+        """
+        return sum(len(s) for s in list(self._subscriptions))
+
+    def max_queue_depth(self) -> int:
+        """Gauge callback; see queued_events."""
+        return max((len(s) for s in list(self._subscriptions)), default=0)
+
+
+broadcaster = Broadcaster(SSE_QUEUE_SIZE, SSE_OVERFLOW_POLICY, SSE_REPLAY_SIZE)
+
+sample_gauge(SSE_QUEUED_EVENTS, broadcaster.queued_events)
+sample_gauge(SSE_MAX_QUEUE_DEPTH, broadcaster.max_queue_depth)
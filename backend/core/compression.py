@@ -0,0 +1,129 @@
+from typing import Set
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import (
+    DEFAULT_EXCLUDED_CONTENT_TYPES,
+    GZipResponder,
+    IdentityResponder,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only without it
+    brotli = None
+
+
+def _is_excluded(headers: Headers) -> bool:
+    """
+    Event streams must reach the client as they are written, and files
+    (attachments) are served with Range support, which byte offsets into a
+    compressed body would break; attachments are also mostly compressed
+    already.
+    """
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(DEFAULT_EXCLUDED_CONTENT_TYPES) or (
+        "accept-ranges" in headers
+    )
+
+
+class _SelectiveMixin:
+    """
+    Starlette's responders extended to pass excluded responses, and files
+    sent through the `http.response.pathsend` extension, through untouched.
+    """
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.pathsend":
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        await super().send_with_compression(message)
+        if message["type"] == "http.response.start" and _is_excluded(
+            Headers(raw=message["headers"])
+        ):
+            # Takes Starlette's path for responses that are already encoded
+            self.content_encoding_set = True
+
+
+class _IdentityResponder(_SelectiveMixin, IdentityResponder):
+    pass
+
+
+class _GZipResponder(_SelectiveMixin, GZipResponder):
+    pass
+
+
+class _BrotliResponder(_SelectiveMixin, IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        body = self.compressor.process(body)
+        # Streamed chunks are flushed so the client can decode them as they come
+        if more_body:
+            return body + self.compressor.flush()
+        return body + self.compressor.finish()
+
+
+def _accepted_encodings(accept_encoding: str) -> Set[str]:
+    encodings = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and float(params[2:] or 0) == 0:
+            continue
+        encodings.add(coding.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses of at least `minimum_size` bytes with brotli, when
+    the package is installed and the client accepts it, or gzip. Event
+    streams and file responses are sent as they are.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            accepted = _accepted_encodings(
+                Headers(scope=scope).get("accept-encoding", "")
+            )
+        except ValueError:
+            accepted = set()
+
+        responder: ASGIApp
+        if brotli is not None and "br" in accepted:
+            responder = _BrotliResponder(
+                self.app, self.minimum_size, quality=self.brotli_quality
+            )
+        elif "gzip" in accepted:
+            responder = _GZipResponder(
+                self.app, self.minimum_size, compresslevel=self.gzip_level
+            )
+        else:
+            responder = _IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
@@ -21,6 +21,16 @@ POSTGRES_HOST = os.getenv("POSTGRES_HOST", "db")  # default to Docker service na
 
 # Compose DATABASE_URL
 DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+
+# Connection pool, applied to both the sync and async engines. Pre-ping costs a
+# round trip per checkout; with it disabled, rely on DB_POOL_RECYCLE (seconds,
+# -1 to never recycle) to retire connections before the server drops them.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 
 # Secret for JWT
 JWT_SECRET = must_get_env("JWT_SECRET")
@@ -30,3 +40,53 @@ DEFAULT_ADMIN_EMAIL = must_get_env("DEFAULT_ADMIN_EMAIL")
 DEFAULT_ADMIN_PASSWORD = must_get_env("DEFAULT_ADMIN_PASSWORD")
 
 BASE_PATH = must_get_env("BASE_PATH")
+
+# Process pool for bcrypt hashing/verification, and how many calls may be
+# handed to it at once before further logins queue in the event loop
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+PASSWORD_HASH_CONCURRENCY = int(
+    os.getenv("PASSWORD_HASH_CONCURRENCY", 2 * PASSWORD_HASH_WORKERS)
+)
+
+# Authenticated user cache (see dependencies.get_current_user)
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_SIZE = int(os.getenv("AUTH_CACHE_MAX_SIZE", "1024"))
+
+# Run the stats jobs on an in-app AsyncIOScheduler instead of worker.py; with
+# several replicas a Postgres advisory lock elects the one that runs them
+EMBEDDED_SCHEDULER = os.getenv("EMBEDDED_SCHEDULER", "false").lower() == "true"
+
+# /stats responses cache; cleared whenever issues or stats change
+STATS_CACHE_TTL_SECONDS = int(os.getenv("STATS_CACHE_TTL_SECONDS", "300"))
+STATS_CACHE_MAX_SIZE = int(os.getenv("STATS_CACHE_MAX_SIZE", "256"))
+
+# Response compression: bodies from COMPRESSION_MINIMUM_SIZE bytes up are sent
+# brotli-encoded when the optional brotli package is installed and the client
+# accepts it, gzip otherwise
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+GZIP_COMPRESSION_LEVEL = int(os.getenv("GZIP_COMPRESSION_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+# How often each worker writes out its computed gauges (DB pools, SSE queues)
+# when metrics are aggregated across workers via PROMETHEUS_MULTIPROC_DIR
+METRICS_SAMPLE_INTERVAL_SECONDS = float(
+    os.getenv("METRICS_SAMPLE_INTERVAL_SECONDS", "5")
+)
+
+# Per-client SSE buffer; on overflow either "drop_oldest" or "disconnect"
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "100"))
+SSE_OVERFLOW_POLICY = os.getenv("SSE_OVERFLOW_POLICY", "drop_oldest")
+# Recent events kept for clients resuming with Last-Event-ID
+SSE_REPLAY_SIZE = int(os.getenv("SSE_REPLAY_SIZE", "1000"))
+
+# Attachments are written in UPLOAD_CHUNK_SIZE pieces and rejected (413) as
+# soon as they grow past MAX_UPLOAD_SIZE_BYTES
+MAX_UPLOAD_SIZE_BYTES = int(os.getenv("MAX_UPLOAD_SIZE_BYTES", 25 * 1024 * 1024))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 1024 * 1024))
+# Room for the other form fields and multipart framing when a request body
+# carrying an attachment is refused up front (see UploadSizeLimitMiddleware)
+UPLOAD_FORM_OVERHEAD_BYTES = int(os.getenv("UPLOAD_FORM_OVERHEAD_BYTES", 1024 * 1024))
+
+# When set (e.g. "/protected-uploads/"), attachment downloads are handed to a
+# fronting nginx via X-Accel-Redirect, which serves them with sendfile
+ATTACHMENT_ACCEL_REDIRECT_PREFIX = os.getenv("ATTACHMENT_ACCEL_REDIRECT_PREFIX")
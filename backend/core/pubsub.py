@@ -0,0 +1,135 @@
+import asyncio
+import json
+from typing import Any, Callable, Dict, Optional
+
+import psycopg2
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import DATABASE_URL
+from core.logging import logger
+
+ISSUE_EVENTS_CHANNEL = "issue_events"
+STATS_EVENTS_CHANNEL = "stats_events"
+USER_EVENTS_CHANNEL = "user_events"
+RECONNECT_DELAY_SECONDS = 3
+
+
+async def notify_issue_event(db: AsyncSession, message: Any) -> None:
+    """
+    Queues an issue event on the session's transaction. Postgres only delivers
+    it, to every listening process, once the transaction commits. The event id
+    comes from a shared sequence so it means the same thing on every replica.
+    """
+    await db.execute(
+        text(
+            "SELECT pg_notify(:channel, json_build_object("
+            "'id', nextval('issue_event_id_seq'), 'data', CAST(:payload AS json)"
+            ")::text)"
+        ),
+        {"channel": ISSUE_EVENTS_CHANNEL, "payload": json.dumps(message)},
+    )
+
+
+def notify_stats_changed(db: Session) -> None:
+    """
+    Tells every API process, once the session's transaction commits, that
+    stats were rewritten outside of an issue write.
+    """
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": STATS_EVENTS_CHANNEL, "payload": json.dumps({})},
+    )
+
+
+async def notify_user_changed(db: AsyncSession, user_id: int) -> None:
+    """
+    Tells every API process, once the session's transaction commits, that a
+    user's role or existence changed, so they drop cached sessions of it.
+    """
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": USER_EVENTS_CHANNEL, "payload": json.dumps({"user_id": user_id})},
+    )
+
+
+class NotificationListener:
+    """
+    Holds one dedicated LISTEN connection per process and hands each
+    notification to the handler registered for its channel, from the event
+    loop, so local state follows writes made by any worker or replica.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[Any], None]]):
+        self.handlers = handlers
+        self._conn = None
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopped = False
+        await self._connect()
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+        self._close()
+
+    def _open(self):
+        conn = psycopg2.connect(DATABASE_URL)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            for channel in self.handlers:
+                cursor.execute(f"LISTEN {channel}")
+        return conn
+
+    async def _connect(self) -> None:
+        while not self._stopped:
+            try:
+                self._conn = await asyncio.to_thread(self._open)
+                break
+            except psycopg2.Error as e:
+                logger.warning(
+                    {"event": "notification_listener_connect_failed", "error": str(e)}
+                )
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+        else:
+            return
+
+        self._fd = self._conn.fileno()
+        self._loop.add_reader(self._fd, self._on_readable)
+        logger.info(
+            {"event": "notification_listener_started", "channels": list(self.handlers)}
+        )
+
+    def _close(self) -> None:
+        if self._conn is None:
+            return
+        self._loop.remove_reader(self._fd)
+        self._conn.close()
+        self._conn = None
+
+    def _on_readable(self) -> None:
+        try:
+            self._conn.poll()
+        except psycopg2.Error as e:
+            logger.error(
+                {"event": "notification_listener_connection_lost", "error": str(e)}
+            )
+            self._close()
+            self._reconnect_task = self._loop.create_task(self._connect())
+            return
+
+        while self._conn.notifies:
+            notification = self._conn.notifies.pop(0)
+            try:
+                self.handlers[notification.channel](json.loads(notification.payload))
+            except Exception as e:
+                logger.error(
+                    {"event": "notification_listener_dispatch_error", "error": str(e)}
+                )
@@ -0,0 +1,92 @@
+import mimetypes
+import os
+from typing import Optional, Tuple
+
+import anyio
+from starlette.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+# Uploads are named by whoever uploaded them; only these types are shown inline,
+# as none of them can run script in the viewer's session
+INLINE_ATTACHMENT_TYPES = frozenset(
+    {"image/png", "image/jpeg", "image/gif", "image/webp", "application/pdf"}
+)
+
+# Sent with every attachment: never sniff a scriptable type out of the bytes,
+# and render even inline files in a unique origin without script
+ATTACHMENT_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "Content-Security-Policy": "sandbox",
+}
+
+
+def attachment_presentation(filename: str) -> Tuple[str, str]:
+    """
+    The media type and Content-Disposition type to serve an uploaded file
+    with. Anything outside INLINE_ATTACHMENT_TYPES is downloaded as opaque
+    bytes rather than rendered.
+    """
+    media_type = mimetypes.guess_type(filename)[0]
+    if media_type in INLINE_ATTACHMENT_TYPES:
+        return media_type, "inline"
+    return "application/octet-stream", "attachment"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluates an If-None-Match header against `etag` using the weak comparison
+    RFC 9110 prescribes for this header.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def if_match_fails(if_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-Match header rules out a write to the representation with
+    `etag`, using the strong comparison RFC 9110 prescribes for this header.
+    A missing header or "*" never fails.
+    """
+    if not if_match or if_match.strip() == "*":
+        return False
+    if etag.startswith("W/"):
+        return True
+    return etag not in (tag.strip() for tag in if_match.split(","))
+
+
+class AttachmentResponse(FileResponse):
+    """
+    FileResponse that lets the ASGI server send the file itself (e.g. with
+    sendfile) through the `http.response.pathsend` extension when the server
+    offers it. Range requests and servers without the extension fall back to
+    Starlette's chunked streaming.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_headers = dict(scope.get("headers", []))
+        if (
+            "http.response.pathsend" not in scope.get("extensions", {})
+            or scope["method"] == "HEAD"
+            or b"range" in request_headers
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+        self.set_stat_headers(stat_result)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        await send(
+            {"type": "http.response.pathsend", "path": os.path.abspath(self.path)}
+        )
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,158 @@
+import functools
+import threading
+import time
+from typing import Callable
+
+import psycopg2
+from apscheduler.schedulers.base import BaseScheduler
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from core.config import DATABASE_URL
+from core.logging import logger
+from core.pubsub import notify_stats_changed
+from core.stats import backfill_stats, reconcile_issue_counts, snapshot_daily_stats
+from db import SessionLocal
+
+# Application-wide key of the advisory lock held by the stats scheduler leader
+STATS_SCHEDULER_LOCK_ID = 7351842001
+
+
+class LeaderLock:
+    """
+    Cluster-wide leadership held as a session-level Postgres advisory lock on
+    a dedicated connection. The holder keeps it until its process or
+    connection dies, after which the next `try_acquire` elsewhere takes over.
+    """
+
+    def __init__(self, lock_id: int):
+        self.lock_id = lock_id
+        self._conn = None
+        self._mutex = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Returns whether this process is (still) the leader."""
+        with self._mutex:
+            if self._conn is not None:
+                try:
+                    with self._conn.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                    return True
+                except psycopg2.Error as e:
+                    logger.warning(
+                        {"event": "scheduler_leadership_lost", "error": str(e)}
+                    )
+                    self._close()
+
+            try:
+                conn = psycopg2.connect(DATABASE_URL)
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_try_advisory_lock(%s)", (self.lock_id,))
+                    acquired = cursor.fetchone()[0]
+            except psycopg2.Error as e:
+                logger.warning(
+                    {"event": "scheduler_leader_election_failed", "error": str(e)}
+                )
+                return False
+
+            if not acquired:
+                conn.close()
+                return False
+            self._conn = conn
+            logger.info({"event": "scheduler_leadership_acquired"})
+            return True
+
+    def release(self) -> None:
+        with self._mutex:
+            self._close()
+
+    def _close(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            # Closing the session releases the advisory lock
+            self._conn.close()
+        except psycopg2.Error:
+            pass
+        self._conn = None
+
+
+leader_lock = LeaderLock(STATS_SCHEDULER_LOCK_ID)
+
+
+def get_db_with_retries(retries=5, delay=3) -> Session:
+    for i in range(retries):
+        try:
+            db = SessionLocal()
+            # Test connection
+            db.execute(text("SELECT 1"))
+            return db
+        except OperationalError as e:
+            logger.warning(
+                {"event": "scheduler_db_not_ready", "attempt": i + 1, "error": str(e)}
+            )
+            time.sleep(delay)
+    raise Exception("Failed to connect to the database after multiple retries.")
+
+
+def aggregate_daily_stats():
+    """
+    Copies the running counters into today's stats and the current week and
+    month rollups. The counters are maintained by the API as issues change,
+    so this no longer scans issues.
+    """
+    db: Session = get_db_with_retries()
+    try:
+        snapshot_daily_stats(db)
+        notify_stats_changed(db)
+        db.commit()
+        logger.info({"event": "daily_stats_updated"})
+    except Exception as e:
+        logger.error({"event": "daily_stats_update_failed", "error": str(e)})
+    finally:
+        db.close()
+
+
+def reconcile_daily_stats():
+    """Recounts issues once a day to correct any drift in the counters."""
+    db: Session = get_db_with_retries()
+    try:
+        drift = reconcile_issue_counts(db)
+        notify_stats_changed(db)
+        db.commit()
+        logger.info({"event": "daily_stats_reconciled", "drift": drift})
+    except Exception as e:
+        logger.error({"event": "daily_stats_reconcile_failed", "error": str(e)})
+    finally:
+        db.close()
+
+
+def run_backfill():
+    db: Session = get_db_with_retries()
+    try:
+        scanned = backfill_stats(db)
+        notify_stats_changed(db)
+        db.commit()
+        logger.info({"event": "daily_stats_backfilled", "issues": scanned})
+    finally:
+        db.close()
+
+
+def _leader_only(job: Callable[[], None]) -> Callable[[], None]:
+    @functools.wraps(job)
+    def run():
+        if leader_lock.try_acquire():
+            job()
+
+    return run
+
+
+def add_stats_jobs(scheduler: BaseScheduler) -> None:
+    """
+    Registers the stats jobs. Every process may schedule them; only the one
+    holding the leader lock actually runs them.
+    """
+    scheduler.add_job(_leader_only(aggregate_daily_stats), "interval", minutes=30)
+    scheduler.add_job(_leader_only(reconcile_daily_stats), "cron", hour=3)
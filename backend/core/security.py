@@ -1,7 +1,25 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from core.config import PASSWORD_HASH_CONCURRENCY, PASSWORD_HASH_WORKERS
+from core.logging import logger
+from monitoring.metrics import PASSWORD_HASH_QUEUE_SECONDS, PASSWORD_HASH_SECONDS
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is CPU bound, so request handlers hand it to a dedicated process pool
+# instead of the shared threadpool. The semaphore caps how many calls may be
+# queued on the pool at once; everything beyond that waits (and is timed) here.
+_executor: Optional[ProcessPoolExecutor] = None
+_slots = asyncio.Semaphore(PASSWORD_HASH_CONCURRENCY)
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -9,3 +27,72 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: forking a process that already runs an event loop and
+        # threadpool is not safe
+        _executor = ProcessPoolExecutor(
+            max_workers=PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Drops a broken pool so the next call builds a fresh one."""
+    global _executor
+    if _executor is executor:
+        _executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_pool(operation: str, func, *args):
+    queued_at = time.perf_counter()
+    async with _slots:
+        started_at = time.perf_counter()
+        PASSWORD_HASH_QUEUE_SECONDS.labels(operation=operation).observe(
+            started_at - queued_at
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            # A worker that dies (OOM kill, crash) breaks the whole pool;
+            # replace it and retry once before failing the request
+            for attempt in range(2):
+                executor = _get_executor()
+                try:
+                    return await loop.run_in_executor(executor, func, *args)
+                except BrokenProcessPool:
+                    logger.error(
+                        {
+                            "event": "password_pool_broken",
+                            "operation": operation,
+                            "attempt": attempt + 1,
+                        }
+                    )
+                    _discard_executor(executor)
+            raise HTTPException(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Password hashing is temporarily unavailable",
+            )
+        finally:
+            PASSWORD_HASH_SECONDS.labels(operation=operation).observe(
+                time.perf_counter() - started_at
+            )
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_pool("hash", hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_in_pool("verify", verify_password, plain, hashed)
+
+
+def shutdown_password_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
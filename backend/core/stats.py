@@ -0,0 +1,262 @@
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, Mapping, Optional
+
+from sqlalchemy import delete, func, insert, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models.daily_stats import DailyStats
+from models.issue import Issue, Severity, Status
+from models.issue_severity_count import IssueSeverityCount
+from models.issue_status_count import IssueStatusCount
+from models.stats_rollup import StatsRollup
+
+PERIODS = ("day", "week", "month")
+
+# Running counter table and key column for each dimension stats are kept for
+_COUNTERS = {
+    "status": (IssueStatusCount, IssueStatusCount.status),
+    "severity": (IssueSeverityCount, IssueSeverityCount.severity),
+}
+_VALUES = {
+    "status": [s.value for s in Status],
+    "severity": [s.value for s in Severity],
+}
+# What every issue starts out as when it is created
+_INITIAL = {"status": Status.OPEN.value, "severity": Severity.LOW.value}
+
+
+def bucket_start(period: str, day: date) -> date:
+    """The first day of the `period` bucket containing `day`."""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
+
+
+def counted_state(issue: Issue) -> Dict[str, str]:
+    """The values `issue` contributes to each counted dimension."""
+    return {
+        "status": Status(issue.status).value,
+        "severity": Severity(issue.severity).value,
+    }
+
+
+def issue_deltas(
+    old: Optional[Mapping[str, str]] = None, new: Optional[Mapping[str, str]] = None
+) -> Dict[str, Dict[str, int]]:
+    """
+    The counter changes for one issue moving from the `old` to the `new`
+    counted state; either side is None for a create or a delete.
+    """
+    deltas = {dimension: Counter() for dimension in _COUNTERS}
+    for state, sign in ((old, -1), (new, 1)):
+        for dimension, value in (state or {}).items():
+            deltas[dimension][value] += sign
+    return {
+        dimension: {value: d for value, d in changes.items() if d}
+        for dimension, changes in deltas.items()
+    }
+
+
+def sum_deltas(
+    changes: Iterable[Mapping[str, Mapping[str, int]]],
+) -> Dict[str, Dict[str, int]]:
+    """Combines the `issue_deltas` of several issues into one set of changes."""
+    total = {dimension: Counter() for dimension in _COUNTERS}
+    for deltas in changes:
+        for dimension, counts in deltas.items():
+            total[dimension].update(counts)
+    return {
+        dimension: {value: d for value, d in counts.items() if d}
+        for dimension, counts in total.items()
+    }
+
+
+def _daily_stats_snapshot(day: date, statuses=None):
+    """Upserts `day`'s daily_stats rows from the running status counters."""
+    source = select(IssueStatusCount.status, literal(day), IssueStatusCount.count)
+    if statuses is not None:
+        source = source.where(IssueStatusCount.status.in_(statuses))
+    stmt = pg_insert(DailyStats).from_select(["status", "date", "count"], source)
+    return stmt.on_conflict_do_update(
+        index_elements=[DailyStats.status, DailyStats.date],
+        set_={"count": stmt.excluded.count},
+    )
+
+
+def _rollup_snapshot(period: str, dimension: str, day: date):
+    """Upserts the running counters as the rollup bucket containing `day`."""
+    model, key = _COUNTERS[dimension]
+    source = select(
+        literal(period),
+        literal(dimension),
+        literal(bucket_start(period, day)),
+        key,
+        model.count,
+    )
+    stmt = pg_insert(StatsRollup).from_select(
+        ["period", "dimension", "bucket", "value", "count"], source
+    )
+    return stmt.on_conflict_do_update(
+        constraint="uix_stats_rollup_bucket", set_={"count": stmt.excluded.count}
+    )
+
+
+async def apply_issue_deltas(
+    db: AsyncSession, deltas: Mapping[str, Mapping[str, int]]
+) -> None:
+    """
+    Adds `deltas` to the running counters and refreshes today's daily_stats
+    rows for the touched statuses, on the caller's transaction. Costs one row
+    per touched value regardless of how many issues exist.
+
+    Writers call this last, right before committing: every writer then takes
+    its issue and attachment row locks before the shared counter rows, and
+    holds those hot rows only for the commit itself.
+    """
+    for dimension, changes in deltas.items():
+        changes = {value: d for value, d in changes.items() if d}
+        if not changes:
+            continue
+        model, key = _COUNTERS[dimension]
+        # Sorted so concurrent writers lock counter rows in the same order
+        rows = [{key.name: value, "count": changes[value]} for value in sorted(changes)]
+        stmt = pg_insert(model).values(rows)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[key],
+                set_={"count": model.count + stmt.excluded.count},
+            )
+        )
+    if deltas.get("status"):
+        await db.execute(_daily_stats_snapshot(date.today(), list(deltas["status"])))
+
+
+def snapshot_daily_stats(db: Session, day: Optional[date] = None) -> None:
+    """
+    Writes the current counters as `day`'s stats and as the latest value of
+    the week and month rollups containing it, so every status and severity
+    has a row even on days it did not change.
+    """
+    day = day or date.today()
+    db.execute(_daily_stats_snapshot(day))
+    for period in PERIODS:
+        for dimension in _COUNTERS:
+            db.execute(_rollup_snapshot(period, dimension, day))
+
+
+def current_counts(db: Session, dimension: str) -> Dict[str, int]:
+    """The running counters for `dimension`, keyed by value."""
+    model, key = _COUNTERS[dimension]
+    return dict(db.execute(select(key, model.count).order_by(key)).all())
+
+
+def reconcile_issue_counts(db: Session) -> Dict[str, Dict[str, int]]:
+    """
+    Recounts issues per status and severity and corrects the running
+    counters, returning the drift that was fixed. Counter writers are blocked
+    for the duration so the recount and the counters describe the same set
+    of committed issues.
+    """
+    db.execute(
+        text("LOCK TABLE issue_status_counts, issue_severity_counts IN EXCLUSIVE MODE")
+    )
+    drift = {}
+    for dimension, (model, key) in _COUNTERS.items():
+        column = getattr(Issue, dimension)
+        actual = {
+            value.value: count
+            for value, count in db.execute(
+                select(column, func.count(Issue.id)).group_by(column)
+            )
+        }
+        stored = dict(db.execute(select(key, model.count)).all())
+
+        drift[dimension] = {}
+        for value in set(actual) | set(stored):
+            expected = actual.get(value, 0)
+            if stored.get(value, 0) != expected:
+                drift[dimension][value] = expected - stored.get(value, 0)
+                db.merge(model(**{key.name: value, "count": expected}))
+    db.flush()
+    snapshot_daily_stats(db)
+    return {dimension: changes for dimension, changes in drift.items() if changes}
+
+
+def backfill_stats(db: Session, batch_size: int = 1000) -> int:
+    """
+    Rebuilds daily_stats and every rollup from issue history in one
+    streaming pass, replacing what is stored, and returns how many issues
+    were read.
+
+    Only the current state of an issue is stored, so each one is taken to
+    have been created OPEN/LOW on its `created_at` day and to have reached
+    its current status and severity on its `updated_at` day. Deleted issues
+    are not represented.
+    """
+    today = date.today()
+    first_day = today
+    # day -> (dimension, value) -> change in the number of issues
+    deltas: Dict[date, Counter] = defaultdict(Counter)
+    scanned = 0
+
+    rows = db.execute(
+        select(Issue.created_at, Issue.updated_at, Issue.status, Issue.severity),
+        execution_options={"yield_per": batch_size},
+    )
+    for created_at, updated_at, status, severity in rows:
+        created = min(created_at.date() if created_at else today, today)
+        changed = min(max(updated_at.date() if updated_at else created, created), today)
+        first_day = min(first_day, created)
+        current = {"status": Status(status).value, "severity": Severity(severity).value}
+        for dimension, initial in _INITIAL.items():
+            deltas[created][(dimension, initial)] += 1
+            if current[dimension] != initial:
+                deltas[changed][(dimension, initial)] -= 1
+                deltas[changed][(dimension, current[dimension])] += 1
+        scanned += 1
+
+    # Later days overwrite earlier ones, leaving each bucket's closing count
+    running: Counter = Counter()
+    rollups: Dict[tuple, int] = {}
+    day = first_day
+    while day <= today:
+        running.update(deltas.pop(day, Counter()))
+        for dimension, values in _VALUES.items():
+            for value in values:
+                for period in PERIODS:
+                    bucket = bucket_start(period, day)
+                    rollups[(period, dimension, bucket, value)] = running[
+                        (dimension, value)
+                    ]
+        day += timedelta(days=1)
+
+    db.execute(delete(StatsRollup))
+    db.execute(delete(DailyStats))
+    if rollups:
+        db.execute(
+            insert(StatsRollup),
+            [
+                {
+                    "period": period,
+                    "dimension": dimension,
+                    "bucket": bucket,
+                    "value": value,
+                    "count": count,
+                }
+                for (period, dimension, bucket, value), count in rollups.items()
+            ],
+        )
+        db.execute(
+            insert(DailyStats),
+            [
+                {"status": value, "date": bucket, "count": count}
+                for (period, dimension, bucket, value), count in rollups.items()
+                if period == "day" and dimension == "status"
+            ],
+        )
+    return scanned
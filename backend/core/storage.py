@@ -0,0 +1,97 @@
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import uuid4
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+from core.uploads import save_upload
+
+
+@dataclass
+class StagedBlob:
+    """An upload that has been hashed and written out, but not yet published."""
+
+    sha256: str
+    size: int
+    extension: str
+    staging_path: str
+
+
+class AttachmentStore(ABC):
+    """
+    Storage backend for issue attachments. Blobs are addressed by the SHA-256
+    of their content; reference counting is left to the caller's database
+    transaction (see models.attachment.Attachment).
+    """
+
+    @abstractmethod
+    async def stage(self, file: UploadFile) -> StagedBlob: ...
+
+    @abstractmethod
+    def blob_path(self, staged: StagedBlob) -> str:
+        """Where a blob with this content lives once published."""
+
+    @abstractmethod
+    async def publish(self, staged: StagedBlob, path: str) -> None:
+        """Moves a staged upload to `path`, or drops it if `path` exists."""
+
+    @abstractmethod
+    async def discard(self, staged: StagedBlob) -> None: ...
+
+    @abstractmethod
+    async def delete(self, path: str) -> None: ...
+
+
+class LocalContentAddressedStore(AttachmentStore):
+    """
+    Keeps blobs under `root/ab/cd/<sha256><ext>`, so no directory grows beyond
+    a few hundred entries however many attachments are stored.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.staging_dir = os.path.join(root, ".staging")
+        os.makedirs(self.staging_dir, exist_ok=True)
+
+    async def stage(self, file: UploadFile) -> StagedBlob:
+        staging_path = os.path.join(self.staging_dir, uuid4().hex)
+        stored = await save_upload(file, staging_path)
+        extension = os.path.splitext(os.path.basename(file.filename))[1].lower()
+        return StagedBlob(
+            sha256=stored.sha256,
+            size=stored.size,
+            extension=extension,
+            staging_path=staging_path,
+        )
+
+    def blob_path(self, staged: StagedBlob) -> str:
+        digest = staged.sha256
+        return os.path.join(
+            self.root, digest[:2], digest[2:4], f"{digest}{staged.extension}"
+        )
+
+    async def publish(self, staged: StagedBlob, path: str) -> None:
+        await run_in_threadpool(self._publish, staged.staging_path, path)
+
+    @staticmethod
+    def _publish(staging_path: str, path: str) -> None:
+        if os.path.exists(path):
+            os.remove(staging_path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(staging_path, path)
+
+    async def discard(self, staged: StagedBlob) -> None:
+        await run_in_threadpool(self._remove, staged.staging_path)
+
+    async def delete(self, path: str) -> None:
+        await run_in_threadpool(self._remove, path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
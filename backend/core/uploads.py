@@ -0,0 +1,118 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Mapping, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import MAX_UPLOAD_SIZE_BYTES, UPLOAD_CHUNK_SIZE
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+@dataclass
+class StoredUpload:
+    path: str
+    size: int
+    sha256: str
+
+
+def _copy_chunked(source, destination: str, max_size: int) -> StoredUpload:
+    """
+    Copies `source` to `destination` chunk by chunk, hashing as it goes and
+    giving up as soon as more than `max_size` bytes have been read.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(destination, "wb") as out:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLarge()
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        os.remove(destination)
+        raise
+    return StoredUpload(path=destination, size=size, sha256=digest.hexdigest())
+
+
+async def save_upload(
+    file: UploadFile, destination: str, max_size: int = MAX_UPLOAD_SIZE_BYTES
+) -> StoredUpload:
+    """
+    Streams an upload to `destination` on a worker thread so the event loop is
+    never blocked on disk I/O. Raises 413 once the size limit is crossed.
+    """
+    try:
+        return await run_in_threadpool(_copy_chunked, file.file, destination, max_size)
+    except UploadTooLarge:
+        raise HTTPException(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Attachment exceeds {max_size} bytes",
+        )
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Caps the request body of the routes in `limits`, keyed by (method, path),
+    before the form is parsed. Starlette spools a whole multipart body to
+    temporary files before the route runs, so save_upload's check alone
+    would only reject an oversized upload once it was fully on disk.
+
+    A Content-Length over the limit is refused without reading the body; a
+    body without one fails with 413 as soon as it streams past the limit.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Mapping[Tuple[str, str], int]):
+        self.app = app
+        self.limits = {
+            (method, path.rstrip("/")): limit
+            for (method, path), limit in limits.items()
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Routes are matched without the prefix the app is mounted under
+        root_path = scope.get("root_path", "").rstrip("/")
+        path = scope["path"].removeprefix(root_path).rstrip("/")
+        limit = self.limits.get((scope["method"], path))
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > limit:
+            response = JSONResponse(
+                {"detail": f"Request body exceeds {limit} bytes"},
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Not caught by the form parser, so it becomes the response
+                    raise HTTPException(
+                        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Request body exceeds {limit} bytes",
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -1,14 +1,109 @@
-from sqlalchemy import create_engine
+import time
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, scoped_session
-from core.config import DATABASE_URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from core.config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+from monitoring.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_OVERFLOW,
+    DB_POOL_CONFIGURED_SIZE,
+    DB_POOL_TIMEOUTS,
+    sample_gauge,
+)
+from monitoring.middleware import record_db_time
+
+
+class _InstrumentedPoolMixin:
+    """Records how long each checkout waits, including pre-ping if enabled."""
+
+    metrics_label = ""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.labels(engine=self.metrics_label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(engine=self.metrics_label).observe(
+                time.perf_counter() - start
+            )
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+POOL_OPTIONS = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+def _export_pool_metrics(engine, label: str) -> None:
+    # Read through `engine.pool`, which is replaced when the engine is disposed
+    sample_gauge(
+        DB_POOL_CONFIGURED_SIZE.labels(engine=label), lambda: engine.pool.size()
+    )
+    sample_gauge(
+        DB_POOL_CHECKED_OUT.labels(engine=label), lambda: engine.pool.checkedout()
+    )
+    sample_gauge(
+        DB_POOL_OVERFLOW.labels(engine=label), lambda: max(engine.pool.overflow(), 0)
+    )
+
+
+def _time_statements(engine) -> None:
+    """Adds the time spent in each statement to the current request's metrics."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, params, context, many):
+        context._metrics_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, params, context, many):
+        record_db_time(time.perf_counter() - context._metrics_start)
+
+
+engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+_export_pool_metrics(engine, "sync")
+_time_statements(engine)
 
 SessionLocal = scoped_session(
     sessionmaker(bind=engine, autocommit=False, autoflush=False)
 )
 Base = declarative_base()
 
+# Async path for `async def` routes, so database I/O never blocks the event loop
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS
+)
+_export_pool_metrics(async_engine.sync_engine, "async")
+_time_statements(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db():
     db = SessionLocal()
@@ -16,3 +111,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
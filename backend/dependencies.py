@@ -1,5 +1,8 @@
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from core.cache import TTLCache
+from core.config import AUTH_CACHE_MAX_SIZE, AUTH_CACHE_TTL_SECONDS
 from core.jwt import decode_access_token
 from db import get_db
 from models.user import User
@@ -7,16 +10,35 @@ from sqlalchemy.orm import Session
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Maps a raw bearer token to its detached User, so repeat requests skip both
+# JWT verification and the user lookup until the entry expires.
+user_cache = TTLCache(max_size=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drops cached sessions of a user whose role or existence changed."""
+    user_cache.delete_where(lambda _, user: user.id == user_id)
+
 
 def get_current_user(
     token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
 ) -> User:
+    user = user_cache.get(token)
+    if user is not None:
+        return user
+
     payload = decode_access_token(token)
     if not payload or "sub" not in payload:
         raise HTTPException(status_code=401, detail="Invalid token")
     user = db.query(User).filter_by(email=payload["sub"]).first()
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
+
+    # Detach so a commit in the request session cannot expire the shared copy
+    db.expunge(user)
+    # Never serve a token from cache past its own expiry
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    user_cache.set(token, user, ttl=expires_in)
     return user
 
 
@@ -33,12 +55,8 @@ def require_sse_user(token: str, db: Session = Depends(get_db)) -> User:
     if not token:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Missing token")
 
-    payload = decode_access_token(token)
-    if not payload:
-        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-
     user = get_current_user(token, db)
-    if not user or user.role.value not in ("MAINTAINER", "ADMIN"):
+    if user.role.value not in ("MAINTAINER", "ADMIN"):
         raise HTTPException(status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
     return user
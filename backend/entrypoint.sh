@@ -27,8 +27,16 @@ EOF
 echo "PostgreSQL is up. Running Alembic migrations..."
 alembic upgrade head
 
-echo "Starting daily stats worker..."
-python worker.py &
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    # Samples left by a previous run would be aggregated with the new workers'
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
+if [ "$EMBEDDED_SCHEDULER" != "true" ]; then
+    echo "Starting daily stats worker..."
+    python worker.py &
+fi
 
 echo "Starting FastAPI app..."
-fastapi run
+fastapi run --workers "${WEB_CONCURRENCY:-1}"
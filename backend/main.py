@@ -1,18 +1,106 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 
-from core.config import BASE_PATH
-from monitoring.metrics import start_metrics_server
+from core.config import (
+    BASE_PATH,
+    BROTLI_QUALITY,
+    COMPRESSION_MINIMUM_SIZE,
+    EMBEDDED_SCHEDULER,
+    GZIP_COMPRESSION_LEVEL,
+    MAX_UPLOAD_SIZE_BYTES,
+    METRICS_SAMPLE_INTERVAL_SECONDS,
+    UPLOAD_FORM_OVERHEAD_BYTES,
+)
+from monitoring.metrics import (
+    MULTIPROCESS,
+    mark_process_dead,
+    render_metrics,
+    sample_gauges_periodically,
+)
+from monitoring.middleware import MetricsMiddleware
 from routers import auth, issues, stats, user
 from db import Base, engine
+from core.broadcaster import broadcaster
+from core.compression import CompressionMiddleware
+from core.pubsub import (
+    ISSUE_EVENTS_CHANNEL,
+    STATS_EVENTS_CHANNEL,
+    USER_EVENTS_CHANNEL,
+    NotificationListener,
+)
+from core.scheduler import add_stats_jobs, leader_lock
+from core.security import shutdown_password_pool
+from core.uploads import UploadSizeLimitMiddleware
+from dependencies import invalidate_user
 
 # Create all tables (in production you'd use Alembic instead)
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Issues & Insights Tracker", version="1.0.0", root_path=BASE_PATH)
 
+def on_issue_event(event: dict) -> None:
+    broadcaster.publish(event)
+    # Issue writes update the stats counters in the same transaction
+    stats.stats_cache.clear()
+
+
+listener = NotificationListener(
+    {
+        ISSUE_EVENTS_CHANNEL: on_issue_event,
+        STATS_EVENTS_CHANNEL: lambda _: stats.stats_cache.clear(),
+        # Role changes and deletions made through any process
+        USER_EVENTS_CHANNEL: lambda event: invalidate_user(event["user_id"]),
+    }
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Code to run on startup
+    sampler = None
+    if MULTIPROCESS:
+        sampler = asyncio.create_task(
+            sample_gauges_periodically(METRICS_SAMPLE_INTERVAL_SECONDS)
+        )
+    # Relay issue events from every process to this process's SSE clients
+    await listener.start()
+    scheduler = None
+    if EMBEDDED_SCHEDULER:
+        scheduler = AsyncIOScheduler()
+        add_stats_jobs(scheduler)
+        scheduler.start()
+    print("Application startup complete.")
+    yield
+    # Code to run on shutdown (after the 'yield')
+    if scheduler:
+        scheduler.shutdown(wait=False)
+        await asyncio.to_thread(leader_lock.release)
+    await listener.stop()
+    shutdown_password_pool()
+    if sampler:
+        sampler.cancel()
+    mark_process_dead()
+    print("Application shutdown complete.")
+
+
+app = FastAPI(
+    title="Issues & Insights Tracker",
+    version="1.0.0",
+    root_path=BASE_PATH,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Refuse oversized attachments before their body is spooled to disk
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits={
+        ("POST", "/api/issues/"): MAX_UPLOAD_SIZE_BYTES + UPLOAD_FORM_OVERHEAD_BYTES
+    },
+)
 # Allow frontend to talk to backend
 app.add_middleware(
     CORSMiddleware,
@@ -20,10 +108,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Next-Offset", "ETag"],
 )
-
-# Serve uploaded files (if stored locally)
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MINIMUM_SIZE,
+    gzip_level=GZIP_COMPRESSION_LEVEL,
+    brotli_quality=BROTLI_QUALITY,
+)
+# Outermost, so it times the whole stack and sees response sizes as sent
+app.add_middleware(MetricsMiddleware)
 
 # Register routes
 app.include_router(auth.router, prefix="/auth", tags=["Auth"])
@@ -31,21 +125,14 @@ app.include_router(issues.router, prefix="/api/issues", tags=["Issues"])
 app.include_router(user.router, prefix="/users", tags=["Users"])
 app.include_router(stats.router, prefix="/stats", tags=["Stats"])
 
-# Start Prometheus server
-start_metrics_server()
-
-
-@asynccontextmanager
-async def lifespan():
-    # Code to run on startup
-    start_metrics_server()
-    print("Application startup complete.")
-    yield
-    # Code to run on shutdown (after the 'yield')
-    print("Application shutdown complete.")
-
 
 # Health check (optional)
 @app.get("/")
 def health_check():
     return {"status": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    body, media_type = render_metrics()
+    return Response(body, media_type=media_type)
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+from .base import Base, utcnow
+
+
+class Attachment(Base):
+    """
+    A stored blob, keyed by the SHA-256 of its content. `ref_count` is the
+    number of issues pointing at it; the blob is removed when it drops to 0.
+    """
+
+    __tablename__ = "attachments"
+
+    sha256 = Column(String(64), primary_key=True)
+    path = Column(String, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime, default=utcnow)
@@ -1,3 +1,13 @@
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+
+def utcnow() -> datetime:
+    """
+    The current UTC time as a naive datetime, to match the `timestamp without
+    time zone` columns; asyncpg rejects aware values for those.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
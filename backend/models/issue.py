@@ -1,8 +1,19 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
-from .base import Base
+from sqlalchemy import (
+    Column,
+    Computed,
+    Integer,
+    String,
+    Text,
+    Enum,
+    ForeignKey,
+    DateTime,
+    Index,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
+from .base import Base, utcnow
 from .user import User
+from .attachment import Attachment
 import enum
 
 
@@ -27,6 +38,11 @@ class Issue(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
     file_path = Column(String, nullable=True)
+    file_name = Column(String, nullable=True)
+    attachment_sha256 = Column(
+        String(64), ForeignKey("attachments.sha256"), nullable=True
+    )
+    attachment = relationship(Attachment)
 
     severity = Column(Enum(Severity), default=Severity.LOW, nullable=False)
     status = Column(Enum(Status), default=Status.OPEN, nullable=False)
@@ -38,9 +54,33 @@ class Issue(Base):
         User, back_populates="issues_reported", passive_deletes=True
     )
 
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
-    updated_at = Column(
-        DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+
+    # Bumped by every ORM write, which also checks it in the UPDATE/DELETE
+    # WHERE clause; doubles as the ETag for optimistic concurrency
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # Weighted full-text document, maintained by Postgres; deferred so normal
+    # loads don't transfer it
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
+
+    # Composite indexes backing keyset pagination on (created_at, id), with
+    # and without the list filters in front of the sort key.
+    __table_args__ = (
+        Index("ix_issues_created_at_id", "created_at", "id"),
+        Index("ix_issues_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_issues_severity_created_at_id", "severity", "created_at", "id"),
+        Index("ix_issues_reporter_id_created_at_id", "reporter_id", "created_at", "id"),
+        Index("ix_issues_search_vector", "search_vector", postgresql_using="gin"),
     )
+    __mapper_args__ = {"version_id_col": version}
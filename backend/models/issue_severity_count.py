@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String
+from .base import Base
+
+
+class IssueSeverityCount(Base):
+    """
+    Running number of issues per severity, maintained alongside
+    `IssueStatusCount`.
+    """
+
+    __tablename__ = "issue_severity_counts"
+
+    severity = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String
+from .base import Base
+
+
+class IssueStatusCount(Base):
+    """
+    Running number of issues per status, kept up to date by the same
+    transactions that create, update and delete issues.
+    """
+
+    __tablename__ = "issue_status_counts"
+
+    status = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
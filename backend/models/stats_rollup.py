@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Date, Integer, String, UniqueConstraint
+from .base import Base
+
+
+class StatsRollup(Base):
+    """
+    Number of issues in each status or severity at the close of a day, week
+    (starting Monday) or month. `bucket` is the first day of the period; the
+    current period holds the latest snapshot.
+    """
+
+    __tablename__ = "stats_rollups"
+
+    id = Column(Integer, primary_key=True)
+    period = Column(String, nullable=False)
+    dimension = Column(String, nullable=False)
+    bucket = Column(Date, nullable=False)
+    value = Column(String, nullable=False)
+    count = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "period", "dimension", "bucket", "value", name="uix_stats_rollup_bucket"
+        ),
+    )
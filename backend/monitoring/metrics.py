@@ -1,13 +1,168 @@
-from prometheus_client import start_http_server, Counter, Summary
-import threading
+import asyncio
+import os
+from typing import Callable, List, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Set (before the process starts) when several workers serve the app; each
+# then writes its samples to files in that directory and /metrics aggregates
+# them. Gauges declare how their per-process values are combined.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
 
 # Metrics
 ISSUES_CREATED = Counter("issues_created_total", "Total number of issues created")
-REQUEST_TIME = Summary("request_processing_seconds", "Time spent processing request")
+
+# HTTP requests, labeled by route template, method and status (see
+# monitoring/middleware.py)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last of its response",
+    ["route", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time a request spent executing database statements",
+    ["route", "method", "status"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_RESPONSE_SIZE_BYTES = Histogram(
+    "http_response_size_bytes",
+    "Size of response bodies as sent, after compression",
+    ["route", "method", "status"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being handled, including open SSE connections",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# Database connection pools, labeled by engine ("sync" / "async")
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled database connection",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT seconds",
+    ["engine"],
+)
+DB_POOL_CONFIGURED_SIZE = Gauge(
+    "db_pool_size", "Configured pool size", ["engine"], multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+
+# Password hashing process pool, labeled by operation ("hash" / "verify")
+PASSWORD_HASH_QUEUE_SECONDS = Histogram(
+    "password_hash_queue_seconds",
+    "Time a bcrypt call waited for a free slot on the hashing pool",
+    ["operation"],
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time a bcrypt call spent on the hashing pool",
+    ["operation"],
+)
+
+# SSE fan-out
+SSE_SUBSCRIBERS = Gauge(
+    "sse_subscribers", "Number of connected SSE clients", multiprocess_mode="livesum"
+)
+SSE_CONNECTION_SECONDS = Histogram(
+    "sse_connection_duration_seconds",
+    "How long SSE clients stayed connected",
+    buckets=(1, 10, 60, 300, 900, 1800, 3600, 3 * 3600, 12 * 3600),
+)
+SSE_EVENTS_PUBLISHED = Counter(
+    "sse_events_published_total", "Total number of events published to SSE clients"
+)
+SSE_EVENTS_DROPPED = Counter(
+    "sse_events_dropped_total",
+    "Events discarded because a client's queue was full",
+    ["reason"],
+)
+SSE_REPLAYS = Counter(
+    "sse_replays_total",
+    "Reconnects with Last-Event-ID, by whether the gap could be replayed",
+    ["outcome"],
+)
+SSE_QUEUED_EVENTS = Gauge(
+    "sse_queued_events",
+    "Events buffered across all SSE client queues",
+    multiprocess_mode="livesum",
+)
+SSE_MAX_QUEUE_DEPTH = Gauge(
+    "sse_max_queue_depth",
+    "Depth of the most backed-up SSE client queue",
+    multiprocess_mode="livemax",
+)
+
+
+# Gauges computed on demand; see sample_gauge
+_sampled_gauges: List[Tuple[Gauge, Callable[[], float]]] = []
+
+
+def sample_gauge(gauge: Gauge, f: Callable[[], float]) -> None:
+    """
+    Reports `f()` as the value of `gauge`. In a single process it is read at
+    scrape time; `set_function` gauges are invisible to multiprocess
+    aggregation, though, so there every worker writes the value out
+    periodically instead (see sample_gauges_periodically).
+    """
+    if MULTIPROCESS:
+        _sampled_gauges.append((gauge, f))
+    else:
+        gauge.set_function(f)
+
+
+def update_sampled_gauges() -> None:
+    for gauge, f in _sampled_gauges:
+        gauge.set(f())
+
+
+async def sample_gauges_periodically(interval: float) -> None:
+    while True:
+        update_sampled_gauges()
+        await asyncio.sleep(interval)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """The exposition of all metrics, across every worker in multiprocess mode."""
+    if not MULTIPROCESS:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    # This worker's gauges can be brought up to date for free
+    update_sampled_gauges()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
 
 
-def start_metrics_server():
-    # Run Prometheus metrics server on port 8001
-    thread = threading.Thread(target=start_http_server, args=(8001,))
-    thread.daemon = True
-    thread.start()
+def mark_process_dead() -> None:
+    """Drops this worker's live gauges from the aggregate when it exits."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,96 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from monitoring.metrics import (
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_SIZE_BYTES,
+    SSE_CONNECTION_SECONDS,
+)
+
+
+class _RequestTimings:
+    __slots__ = ("db_seconds",)
+
+    def __init__(self) -> None:
+        self.db_seconds = 0.0
+
+
+# Set per request; threadpool routes and SQLAlchemy's greenlets run in a copy
+# of the request's context and so add to the same object
+_request_timings: ContextVar[Optional[_RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def record_db_time(seconds: float) -> None:
+    """Adds time spent in a database statement to the current request, if any."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.db_seconds += seconds
+
+
+class MetricsMiddleware:
+    """
+    Records, per route template, method and status: request latency, time
+    spent in database statements and response size, plus the number of
+    requests in flight. SSE connections are long-lived, so their duration goes
+    to a histogram of their own rather than skewing request latency.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        size = 0
+        event_stream = False
+        content_length = 0
+        timings = _RequestTimings()
+        token = _request_timings.set(timings)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size, event_stream, content_length
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = Headers(raw=message["headers"])
+                event_stream = headers.get("content-type", "").startswith(
+                    "text/event-stream"
+                )
+                content_length = int(headers.get("content-length", 0))
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message["type"] == "http.response.pathsend":
+                # The server sends the file itself; trust the declared length
+                size = content_length
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            _request_timings.reset(token)
+
+            # Unmatched paths share one label so scanners can't blow up cardinality
+            route = getattr(scope.get("route"), "path_format", "unmatched")
+            labels = dict(route=route, method=method, status=str(status_code))
+            if event_stream:
+                SSE_CONNECTION_SECONDS.observe(elapsed)
+            else:
+                HTTP_REQUEST_SECONDS.labels(**labels).observe(elapsed)
+            HTTP_REQUEST_DB_SECONDS.labels(**labels).observe(timings.db_seconds)
+            HTTP_RESPONSE_SIZE_BYTES.labels(**labels).observe(size)
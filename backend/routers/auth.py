@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from db import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from db import get_async_db
 from models.user import User, UserOut, UserRole
-from core.security import hash_password, verify_password
+from core.security import hash_password_async, verify_password_async
 from core.jwt import create_access_token
 from core.logging import logger
 
@@ -24,22 +25,21 @@ class AuthResponse(BaseModel):
 
 
 @router.post("/signup", response_model=AuthResponse)
-def signup(auth: AuthRequest, db: Session = Depends(get_db)):
+async def signup(auth: AuthRequest, db: AsyncSession = Depends(get_async_db)):
     logger.info({"event": "signup_attempt", "email": auth.email})
 
-    user = db.query(User).filter_by(email=auth.email).first()
+    user = await db.scalar(select(User).filter_by(email=auth.email))
     if user:
         logger.warning({"event": "signup_failed_email_exists", "email": auth.email})
         raise HTTPException(status_code=400, detail="Email already registered")
 
     new_user = User(
         email=auth.email,
-        password_hash=hash_password(auth.password),
+        password_hash=await hash_password_async(auth.password),
         role=UserRole.REPORTER,
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
 
     logger.info(
         {
@@ -59,13 +59,16 @@ def signup(auth: AuthRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=AuthResponse)
-def login(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
 ):
     logger.info({"event": "login_attempt", "email": form_data.username})
 
-    user = db.query(User).filter_by(email=form_data.username).first()
-    if not user or not verify_password(form_data.password, str(user.password_hash)):
+    user = await db.scalar(select(User).filter_by(email=form_data.username))
+    if not user or not await verify_password_async(
+        form_data.password, str(user.password_hash)
+    ):
         logger.warning({"event": "login_failed", "email": form_data.username})
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
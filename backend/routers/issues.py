@@ -1,5 +1,4 @@
 import asyncio
-from uuid import uuid4
 from fastapi import (
     APIRouter,
     Depends,
@@ -7,54 +6,116 @@ from fastapi import (
     UploadFile,
     File,
     Form,
+    Header,
     HTTPException,
+    Request,
+    Response,
     status,
 )
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.exc import StaleDataError
 from starlette.responses import StreamingResponse
-from monitoring.metrics import ISSUES_CREATED, REQUEST_TIME
-from prometheus_async.aio import time as async_time_decorator
-from db import get_db
-from models.issue import Issue, Severity
+from monitoring.metrics import ISSUES_CREATED
+from db import SessionLocal, get_async_db, get_db
+from models.base import utcnow
+from models.attachment import Attachment
+from models.issue import Issue, Severity, Status
 from models.user import User, UserRole
-from dependencies import get_current_user, require_role, require_sse_user
-from schemas.issue import IssueUpdate, IssueOut
+from dependencies import (
+    get_current_user,
+    require_role,
+    require_sse_user,
+)
+from schemas.issue import (
+    IssueBulkOperation,
+    IssueBulkResult,
+    IssueImportError,
+    IssueImportResult,
+    IssueImportRow,
+    IssueSearchResult,
+    IssueSummary,
+    IssueUpdate,
+    IssueOut,
+)
+import csv
+import io
+import itertools
 import os
-import shutil
 import json
-from typing import List, Optional
+import orjson
+from datetime import timezone
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, Union
+from urllib.parse import quote
+from core.broadcaster import SubscriptionClosed, broadcaster
 from core.logging import logger
+from core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+from core.config import ATTACHMENT_ACCEL_REDIRECT_PREFIX
+from core.pubsub import notify_issue_event
+from core.responses import (
+    ATTACHMENT_SECURITY_HEADERS,
+    AttachmentResponse,
+    attachment_presentation,
+    etag_matches,
+    if_match_fails,
+)
+from core.stats import apply_issue_deltas, counted_state, issue_deltas, sum_deltas
+from core.storage import LocalContentAddressedStore, StagedBlob
 
 router = APIRouter()
 
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+attachment_store = LocalContentAddressedStore(UPLOAD_DIR)
 
-connected_clients: List[asyncio.Queue] = []
+# Built once so list pages are validated and encoded to JSON in one pass
+_issue_list_adapter = TypeAdapter(List[IssueOut])
 
 
 @router.get("/events")
 async def sse_subscribe(
     token: str = Query(..., description="Authentication token"),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
     current_user: User = Depends(require_sse_user),  # Inject the dependency here
 ):
-    client_queue = asyncio.Queue()
-    connected_clients.append(client_queue)
+    subscription = broadcaster.subscribe(last_event_id)
     logger.info(
         {
             "event": "sse_client_connected",
             "message": "New SSE client connected.",
-            "total_clients": len(connected_clients),
+            "total_clients": len(broadcaster),
             "user_id": current_user.id,  # Log user ID for traceability
+            "last_event_id": last_event_id,
         }
     )
 
     async def event_generator():
         try:
+            if subscription.needs_reset:
+                # Missed events are gone; tell the client to reload instead
+                yield b"event: reset\ndata: null\n\n"
             while True:
-                message = await client_queue.get()
-                yield f"data: {json.dumps(message)}\n\n"
+                # Encoded once by the broadcaster, shared by every subscriber
+                _, frame = await subscription.get()
+                yield frame
+        except SubscriptionClosed:
+            logger.warning(
+                {
+                    "event": "sse_client_dropped",
+                    "message": "SSE client fell behind and was disconnected.",
+                    "user_id": current_user.id,
+                }
+            )
         except asyncio.CancelledError:
             logger.info(
                 {
@@ -64,13 +125,12 @@ async def sse_subscribe(
                 }
             )
         finally:
-            if client_queue in connected_clients:
-                connected_clients.remove(client_queue)
+            broadcaster.unsubscribe(subscription)
             logger.info(
                 {
                     "event": "sse_client_removed",
                     "message": "SSE client removed.",
-                    "total_clients": len(connected_clients),
+                    "total_clients": len(broadcaster),
                     "user_id": current_user.id,
                 }
             )
@@ -79,90 +139,631 @@ async def sse_subscribe(
 
 
 @router.post("/", response_model=IssueOut)
-@async_time_decorator(REQUEST_TIME)
 async def create_issue(
     title: str = Form(...),
     description: str = Form(...),
     file: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(require_role(["REPORTER", "MAINTAINER", "ADMIN"])),
 ):
     """
     Creates a new issue and notifies all subscribed SSE clients.
     """
-    with REQUEST_TIME.time():
-        file_path = None
-        file_uploaded = False
-
-        if file and file.filename:
-            os.makedirs(UPLOAD_DIR, exist_ok=True)
-            name, ext = os.path.splitext(file.filename)
-            safe_ext = ext if ext else ""
-            uuid_filename = f"{name}_{uuid4().hex}{safe_ext}"
-            file_path = os.path.join(UPLOAD_DIR, uuid_filename)
-
-            try:
-                with open(file_path, "wb") as buffer:
-                    shutil.copyfileobj(file.file, buffer)
-                file_uploaded = True
-            except Exception as e:
-                logger.error(f"Failed to save file: {e}")
-                file_path = None
-            finally:
-                await file.close()
-
-        issue = Issue(
-            title=title,
-            description=description,
-            severity=Severity.LOW,
-            file_path=file_path,
-            reporter_id=user.id,
-        )
+    staged = None
+
+    if file and file.filename:
+        try:
+            staged = await attachment_store.stage(file)
+        except HTTPException:
+            logger.warning({"event": "file_upload_rejected", "filename": file.filename})
+            raise
+        except Exception as e:
+            logger.error(f"Failed to save file: {e}")
+        finally:
+            await file.close()
+
+    issue = Issue(
+        title=title,
+        description=description,
+        severity=Severity.LOW,
+        reporter_id=user.id,
+    )
+    try:
+        if staged:
+            issue.file_path = await _acquire_attachment(db, staged)
+            issue.file_name = os.path.basename(file.filename)
+            issue.attachment_sha256 = staged.sha256
         db.add(issue)
-        db.commit()
-        db.refresh(issue)
+        await db.flush()
+        # --- SSE: Delivered to every process once the insert commits ---
+        await notify_issue_event(db, f"Issue created: {issue.title} (id={issue.id})")
+        if staged:
+            # Published under the digest lock taken by _acquire_attachment, so
+            # a delete of the last reference cannot remove the file until the
+            # new row is committed and visible to it
+            await attachment_store.publish(staged, issue.file_path)
+        await apply_issue_deltas(db, issue_deltas(new=counted_state(issue)))
+        await db.commit()
+    except BaseException:
+        if staged:
+            await attachment_store.discard(staged)
+        raise
+    await db.refresh(issue, ["reporter"])
 
-        logger.info(
-            {
-                "event": "issue_created",
-                "user_id": user.id,
-                "issue_id": issue.id,
-                "severity": "LOW",
-                "file_uploaded": file_uploaded,
-            }
+    logger.info(
+        {
+            "event": "issue_created",
+            "user_id": user.id,
+            "issue_id": issue.id,
+            "severity": "LOW",
+            "file_uploaded": staged is not None,
+            "file_sha256": staged.sha256 if staged else None,
+        }
+    )
+
+    ISSUES_CREATED.inc()
+
+    return issue
+
+
+@router.get("/", response_model=List[IssueOut])
+def list_issues(
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    status_filter: Optional[Status] = Query(None, alias="status"),
+    severity: Optional[Severity] = Query(None),
+    reporter_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """
+    Lists issues newest first using keyset pagination on (created_at, id).
+    The cursor for the next page is returned in the X-Next-Cursor header and
+    is absent on the last page.
+    """
+    logger.info(
+        {
+            "event": "issue_list_requested",
+            "user_id": user.id,
+            "role": user.role.value,
+            "filters": {
+                "status": status_filter,
+                "severity": severity,
+                "reporter_id": reporter_id,
+            },
+            "cursor": cursor,
+            "limit": limit,
+        }
+    )
+
+    query = (
+        db.query(Issue)
+        .options(joinedload(Issue.reporter))
+        .filter(*_list_filters(user, cursor, status_filter, severity, reporter_id))
+    )
+
+    # Fetch one extra row to know whether another page exists
+    issues = (
+        query.order_by(Issue.created_at.desc(), Issue.id.desc()).limit(limit + 1).all()
+    )
+
+    headers = {}
+    if len(issues) > limit:
+        issues = issues[:limit]
+        last = issues[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
+    return Response(
+        _issue_list_adapter.dump_json(
+            _issue_list_adapter.validate_python(issues, from_attributes=True)
+        ),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _list_filters(
+    user,
+    cursor: Optional[str],
+    status_filter: Optional[Status],
+    severity: Optional[Severity],
+    reporter_id: Optional[int],
+) -> list:
+    """WHERE clauses shared by the issue list views."""
+    filters = []
+    if user.role.value == UserRole.REPORTER.value:
+        filters.append(Issue.reporter_id == user.id)
+    elif reporter_id is not None:
+        filters.append(Issue.reporter_id == reporter_id)
+
+    if status_filter is not None:
+        filters.append(Issue.status == status_filter)
+    if severity is not None:
+        filters.append(Issue.severity == severity)
+
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        filters.append(tuple_(Issue.created_at, Issue.id) < (created_at, last_id))
+    return filters
+
+
+@router.get("/summary", response_model=List[IssueSummary])
+def list_issue_summaries(
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    status_filter: Optional[Status] = Query(None, alias="status"),
+    severity: Optional[Severity] = Query(None),
+    reporter_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """
+    Same listing and paging as `GET /`, projected to the columns list views
+    show. Rows are selected with a single join and encoded straight to JSON,
+    without loading ORM objects or validating each one through Pydantic.
+    """
+    logger.info(
+        {
+            "event": "issue_summary_list_requested",
+            "user_id": user.id,
+            "cursor": cursor,
+            "limit": limit,
+        }
+    )
+
+    # Fetch one extra row to know whether another page exists
+    rows = db.execute(
+        select(
+            Issue.id,
+            Issue.title,
+            Issue.status,
+            Issue.severity,
+            User.email.label("reporter_email"),
+            Issue.created_at,
+            Issue.updated_at,
         )
+        .outerjoin(User, Issue.reporter_id == User.id)
+        .where(*_list_filters(user, cursor, status_filter, severity, reporter_id))
+        .order_by(Issue.created_at.desc(), Issue.id.desc())
+        .limit(limit + 1)
+    ).all()
 
-        # --- SSE: Notify connected clients ---
-        for client_queue in connected_clients:
-            try:
-                await client_queue.put(f"Issue created: {issue.title} (id={issue.id})")
-            except Exception as e:
-                logger.error(f"Failed to send SSE message to client: {e}")
-        # --- End SSE notification ---
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
 
-        ISSUES_CREATED.inc()
+    return Response(
+        orjson.dumps([_export_record(row) for row in rows]),
+        media_type="application/json",
+        headers=headers,
+    )
 
-        return issue
 
+SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 100
+SEARCH_LANGUAGE = "english"
 
-@router.get("/", response_model=List[IssueOut])
-def list_issues(db: Session = Depends(get_db), user=Depends(get_current_user)):
+
+# ts_headline only adds <b></b> around matches; the text around them is user
+# input and has to be escaped first for the result to be safe HTML
+_HTML_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&#39;"),
+)
+
+
+def _html_escaped(column):
+    for char, entity in _HTML_ESCAPES:
+        column = func.replace(column, char, entity)
+    return column
+
+
+@router.get("/search", response_model=List[IssueSearchResult])
+def search_issues(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=MAX_SEARCH_PAGE_SIZE),
+    offset: int = Query(0, ge=0, description="Offset from X-Next-Offset"),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """
+    Full-text search over issue titles and descriptions, best matches first.
+    `q` accepts web-search syntax ("quoted phrases", OR, -excluded). Results
+    carry highlighted titles and description snippets; the offset of the
+    next page is returned in the X-Next-Offset header.
+    """
     logger.info(
-        {"event": "issue_list_requested", "user_id": user.id, "role": user.role.value}
+        {
+            "event": "issue_search_requested",
+            "user_id": user.id,
+            "query": q,
+            "limit": limit,
+            "offset": offset,
+        }
     )
 
-    query = db.query(Issue).options(joinedload(Issue.reporter))
+    query = func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
+    rank = func.ts_rank_cd(Issue.search_vector, query)
 
+    # Rank and page on the GIN index first, so headlines are only built for
+    # the rows that are returned
+    matches = select(Issue.id, rank.label("rank")).where(
+        Issue.search_vector.op("@@")(query)
+    )
     if user.role.value == UserRole.REPORTER.value:
-        return query.filter(Issue.reporter_id == user.id).all()
-    return query.all()
+        matches = matches.where(Issue.reporter_id == user.id)
+    # Fetch one extra row to know whether another page exists
+    page = (
+        matches.order_by(rank.desc(), Issue.id.desc())
+        .limit(limit + 1)
+        .offset(offset)
+        .subquery()
+    )
+
+    rows = db.execute(
+        select(
+            Issue.id,
+            Issue.title,
+            Issue.status,
+            Issue.severity,
+            page.c.rank,
+            func.ts_headline(
+                SEARCH_LANGUAGE, _html_escaped(Issue.title), query, "HighlightAll=true"
+            ).label("title_highlight"),
+            func.ts_headline(
+                SEARCH_LANGUAGE,
+                _html_escaped(Issue.description),
+                query,
+                "MaxFragments=2, MinWords=10, MaxWords=30",
+            ).label("snippet"),
+        )
+        .join(page, page.c.id == Issue.id)
+        .order_by(page.c.rank.desc(), Issue.id.desc())
+    ).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Offset"] = str(offset + limit)
+
+    logger.info(
+        {"event": "issue_search_success", "user_id": user.id, "count": len(rows)}
+    )
+
+    return rows
+
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "severity",
+    "status",
+    "file_path",
+    "reporter_id",
+    "reporter_email",
+    "created_at",
+    "updated_at",
+)
+
+
+def _export_rows(user_id: Optional[int], filters: list):
+    """
+    Yields batches of export rows from a server-side cursor so that only one
+    batch is held in memory at a time. A dedicated session is used because the
+    request-scoped one is closed before the response body is streamed.
+    """
+    stmt = (
+        select(
+            Issue.id,
+            Issue.title,
+            Issue.description,
+            Issue.severity,
+            Issue.status,
+            Issue.file_path,
+            Issue.reporter_id,
+            User.email.label("reporter_email"),
+            Issue.created_at,
+            Issue.updated_at,
+        )
+        .outerjoin(User, Issue.reporter_id == User.id)
+        .where(*filters)
+        .order_by(Issue.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if user_id is not None:
+        stmt = stmt.where(Issue.reporter_id == user_id)
+
+    db = SessionLocal.session_factory()
+    try:
+        for partition in db.execute(stmt).partitions():
+            yield [_export_record(row) for row in partition]
+    finally:
+        db.close()
+
+
+def _export_record(row) -> dict:
+    record = dict(row._mapping)
+    record["severity"] = row.severity.value
+    record["status"] = row.status.value
+    record["created_at"] = row.created_at.isoformat() if row.created_at else None
+    record["updated_at"] = row.updated_at.isoformat() if row.updated_at else None
+    return record
+
+
+def _ndjson_stream(batches):
+    for batch in batches:
+        yield b"".join(orjson.dumps(record) + b"\n" for record in batch)
+
+
+def _csv_stream(batches):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+
+@router.get("/export")
+def export_issues(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    status_filter: Optional[Status] = Query(None, alias="status"),
+    severity: Optional[Severity] = Query(None),
+    user=Depends(get_current_user),
+):
+    """
+    Streams every issue visible to the caller as NDJSON or CSV.
+    """
+    logger.info(
+        {
+            "event": "issue_export_requested",
+            "user_id": user.id,
+            "format": export_format,
+            "filters": {"status": status_filter, "severity": severity},
+        }
+    )
+
+    filters = []
+    if status_filter is not None:
+        filters.append(Issue.status == status_filter)
+    if severity is not None:
+        filters.append(Issue.severity == severity)
+
+    owner_id = user.id if user.role.value == UserRole.REPORTER.value else None
+    batches = _export_rows(owner_id, filters)
+
+    if export_format == "csv":
+        body, media_type = _csv_stream(batches), "text/csv"
+    else:
+        body, media_type = _ndjson_stream(batches), "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="issues.{export_format}"'
+        },
+    )
+
+
+IMPORT_BATCH_SIZE = 1000
+MAX_IMPORT_ERRORS = 100
+IMPORT_COLUMNS = (
+    "title",
+    "description",
+    "severity",
+    "status",
+    "reporter_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def _parse_import(
+    file, import_format: str
+) -> Iterator[Tuple[int, Union[IssueImportRow, str]]]:
+    """
+    Streams `(line, row)` pairs out of an uploaded NDJSON or CSV file, where
+    `row` is either a validated row or the reason it was rejected.
+    """
+    if import_format == "csv":
+        reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8", newline=""))
+        for record in reader:
+            record = {k: v for k, v in record.items() if k and v not in ("", None)}
+            yield reader.line_num, _validate_import(record)
+        return
+
+    for line, raw in enumerate(file, start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError as e:
+            yield line, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line, "Expected a JSON object"
+            continue
+        yield line, _validate_import(record)
+
+
+def _validate_import(record: dict) -> Union[IssueImportRow, str]:
+    try:
+        return IssueImportRow.model_validate(record)
+    except ValueError as e:
+        return "; ".join(
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+        )
+
+
+def _naive_utc(value):
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def _resolve_reporters(
+    db: AsyncSession, rows: List[IssueImportRow], known: Dict[object, int]
+) -> None:
+    """
+    Adds the user ids behind the batch's reporter emails and ids to `known`,
+    keyed by email and by id, with one query for the ones not seen yet.
+    """
+    emails = {r.reporter_email for r in rows if r.reporter_email} - known.keys()
+    ids = {r.reporter_id for r in rows if r.reporter_id} - known.keys()
+    if not emails and not ids:
+        return
+    result = await db.execute(
+        select(User.id, User.email).where((User.email.in_(emails)) | (User.id.in_(ids)))
+    )
+    for user_id, email in result:
+        known[email] = user_id
+        known[user_id] = user_id
+
+
+@router.post("/import", response_model=IssueImportResult)
+async def import_issues(
+    file: UploadFile = File(...),
+    import_format: Optional[Literal["ndjson", "csv"]] = Query(None, alias="format"),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(require_role(["ADMIN"])),
+):
+    """
+    Bulk-loads issues from an NDJSON or CSV file, in the format /export
+    writes, with Postgres COPY in one transaction. Invalid rows are skipped
+    and reported by line; a single SSE event announces the import. The
+    format defaults to the file's extension.
+    """
+    if import_format is None:
+        import_format = "csv" if file.filename.lower().endswith(".csv") else "ndjson"
+    logger.info(
+        {
+            "event": "issue_import_requested",
+            "user_id": user.id,
+            "filename": file.filename,
+            "format": import_format,
+        }
+    )
+
+    parsed = _parse_import(file.file, import_format)
+    reporters: Dict[object, int] = {}
+    imported, failed, errors, deltas = 0, 0, [], []
+
+    def reject(line: int, error: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_IMPORT_ERRORS:
+            errors.append(IssueImportError(line=line, error=error))
+
+    connection = await db.connection()
+    # The driver only opens its transaction on the first statement SQLAlchemy
+    # runs; start it now so every COPY below commits or rolls back with it
+    await connection.execute(select(1))
+    raw = await connection.get_raw_connection()
+    try:
+        while True:
+            # Parsing and validation are CPU work; keep them off the event loop
+            batch = await run_in_threadpool(
+                lambda: list(itertools.islice(parsed, IMPORT_BATCH_SIZE))
+            )
+            if not batch:
+                break
+
+            valid = [(line, row) for line, row in batch if not isinstance(row, str)]
+            for line, row in batch:
+                if isinstance(row, str):
+                    reject(line, row)
+            await _resolve_reporters(db, [row for _, row in valid], reporters)
+
+            now = utcnow()
+            records = []
+            for line, row in valid:
+                reporter = row.reporter_email or row.reporter_id
+                if reporter and reporter not in reporters:
+                    reject(line, f"Unknown reporter: {reporter}")
+                    continue
+                created_at = _naive_utc(row.created_at) or now
+                records.append(
+                    (
+                        row.title,
+                        row.description,
+                        row.severity.value,
+                        row.status.value,
+                        reporters.get(reporter),
+                        created_at,
+                        _naive_utc(row.updated_at) or created_at,
+                    )
+                )
+                deltas.append(
+                    issue_deltas(
+                        new={"status": row.status.value, "severity": row.severity.value}
+                    )
+                )
+
+            if records:
+                await raw.driver_connection.copy_records_to_table(
+                    Issue.__tablename__, records=records, columns=IMPORT_COLUMNS
+                )
+                imported += len(records)
+    except UnicodeDecodeError:
+        await db.rollback()
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST, detail="Import file must be UTF-8 encoded"
+        )
+    except csv.Error as e:
+        await db.rollback()
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST, detail=f"Malformed CSV import file: {e}"
+        )
+    finally:
+        await file.close()
+
+    if imported:
+        # --- SSE: One event for the whole import, delivered on commit ---
+        await notify_issue_event(db, f"Issues imported: {imported} issues")
+        await apply_issue_deltas(db, sum_deltas(deltas))
+    await db.commit()
+
+    logger.info(
+        {
+            "event": "issue_import_completed",
+            "user_id": user.id,
+            "imported": imported,
+            "failed": failed,
+        }
+    )
+    if imported:
+        ISSUES_CREATED.inc(imported)
+
+    errors.sort(key=lambda error: error.line)
+    return IssueImportResult(imported=imported, failed=failed, errors=errors)
+
+
+def _issue_etag(issue: Issue) -> str:
+    """Strong ETag of an issue, taken from its row version."""
+    return f'"{issue.version}"'
 
 
 @router.get("/{issue_id}", response_model=IssueOut)
 def get_issue(
-    issue_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)
+    issue_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
 ):
-    issue = db.query(Issue).get(issue_id)
+    issue = db.get(Issue, issue_id)
     if not issue:
         logger.warning(
             {"event": "issue_not_found", "issue_id": issue_id, "user_id": user.id}
@@ -179,19 +780,117 @@ def get_issue(
         )
         raise HTTPException(403)
 
+    etag = _issue_etag(issue)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
     logger.info({"event": "issue_fetched", "issue_id": issue.id, "user_id": user.id})
 
     return issue
 
 
+@router.get("/{issue_id}/attachment")
+async def download_attachment(
+    issue_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user),
+):
+    """
+    Serves an issue's attachment to users allowed to see the issue, with
+    Range support and a strong content-hash ETag for conditional requests.
+    """
+    row = (
+        await db.execute(
+            select(
+                Issue.reporter_id,
+                Issue.file_path,
+                Issue.file_name,
+                Issue.attachment_sha256,
+            ).where(Issue.id == issue_id)
+        )
+    ).one_or_none()
+    if row is None or not row.file_path:
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+
+    if user.role.value == UserRole.REPORTER.value and row.reporter_id != user.id:
+        logger.warning(
+            {
+                "event": "unauthorized_attachment_access",
+                "issue_id": issue_id,
+                "user_id": user.id,
+            }
+        )
+        raise HTTPException(status.HTTP_403_FORBIDDEN)
+
+    # Revalidate on every use so revoked access is honored, but let unchanged
+    # content come back as a body-less 304
+    headers = {"Cache-Control": "private, no-cache", **ATTACHMENT_SECURITY_HEADERS}
+    if row.attachment_sha256:
+        etag = f'"{row.attachment_sha256}"'
+        headers["ETag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    filename = row.file_name or os.path.basename(row.file_path)
+    media_type, disposition = attachment_presentation(filename)
+
+    if ATTACHMENT_ACCEL_REDIRECT_PREFIX:
+        # nginx serves the body (and any Range) from its internal location
+        relative_path = os.path.relpath(row.file_path, UPLOAD_DIR)
+        headers["X-Accel-Redirect"] = ATTACHMENT_ACCEL_REDIRECT_PREFIX + relative_path
+        headers["Content-Disposition"] = (
+            f"{disposition}; filename*=utf-8''{quote(filename)}"
+        )
+        return Response(headers=headers, media_type=media_type)
+
+    if not await run_in_threadpool(os.path.isfile, row.file_path):
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+
+    return AttachmentResponse(
+        row.file_path,
+        filename=filename,
+        media_type=media_type,
+        content_disposition_type=disposition,
+        headers=headers,
+    )
+
+
+def _raise_issue_conflict(issue_id: int, user) -> None:
+    logger.info(
+        {"event": "issue_write_conflict", "issue_id": issue_id, "user_id": user.id}
+    )
+    raise HTTPException(
+        status.HTTP_412_PRECONDITION_FAILED,
+        detail="The issue was changed by someone else. Reload it and try again.",
+    )
+
+
+async def _load_issue(db: AsyncSession, issue_id: int) -> Optional[Issue]:
+    result = await db.execute(
+        select(Issue).options(joinedload(Issue.reporter)).where(Issue.id == issue_id)
+    )
+    return result.scalar_one_or_none()
+
+
 @router.put("/{issue_id}", response_model=IssueOut)
 async def update_issue(
     issue_id: int,
     payload: IssueUpdate,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
-    issue = db.query(Issue).get(issue_id)
+    """
+    Updates an issue. With If-Match, the write only goes through if the issue
+    is still at that version; either way, a write that loses a race with
+    another one is rejected rather than silently overwriting it.
+    """
+    issue = await _load_issue(db, issue_id)
     if not issue:
         logger.warning(
             {
@@ -202,6 +901,11 @@ async def update_issue(
         )
         raise HTTPException(status.HTTP_404_NOT_FOUND)
 
+    if if_match_fails(if_match, _issue_etag(issue)):
+        _raise_issue_conflict(issue_id, user)
+
+    previous_state = counted_state(issue)
+
     # Allow all users to update title/description
     if payload.title is not None:
         issue.title = payload.title
@@ -210,7 +914,7 @@ async def update_issue(
 
     # Only MAINTAINER and ADMIN can update status/severity
     if payload.status is not None:
-        if user.role not in ("MAINTAINER", "ADMIN"):
+        if user.role.value not in ("MAINTAINER", "ADMIN"):
             logger.info(
                 {
                     "event": "issue_update_forbidden_status",
@@ -226,7 +930,7 @@ async def update_issue(
         issue.status = payload.status
 
     if payload.severity is not None:
-        if user.role not in ("MAINTAINER", "ADMIN"):
+        if user.role.value not in ("MAINTAINER", "ADMIN"):
             logger.info(
                 {
                     "event": "issue_update_forbidden_severity",
@@ -241,8 +945,17 @@ async def update_issue(
             # )
         issue.severity = payload.severity
 
-    db.commit()
-    db.refresh(issue)
+    try:
+        # The UPDATE is conditional on the version loaded above
+        await db.flush()
+    except StaleDataError:
+        _raise_issue_conflict(issue_id, user)
+
+    # --- SSE: Delivered to every process once the update commits ---
+    await notify_issue_event(db, f"Issue updated: {issue.title} (id={issue.id})")
+    await apply_issue_deltas(db, issue_deltas(previous_state, counted_state(issue)))
+    await db.commit()
+    response.headers["ETag"] = _issue_etag(issue)
 
     logger.info(
         {
@@ -253,25 +966,98 @@ async def update_issue(
         }
     )
 
-    # --- SSE: Notify connected clients ---
-    for client_queue in connected_clients:
-        try:
-            # Put the issue data into each client's queue
-            await client_queue.put(f"Issue updated: {issue.title} (id={issue.id})")
-        except Exception as e:
-            logger.error(f"Failed to send SSE message to client: {e}")
-    # --- End SSE notification ---
-
     return issue
 
 
+async def _lock_attachment(db: AsyncSession, sha256: str) -> None:
+    """
+    Serializes reference changes and file removal for one digest until the
+    end of the current transaction. Attachment rows come and go, so the row
+    lock alone cannot order a re-create against a delete of the last
+    reference.
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(sha256))))
+
+
+async def _acquire_attachment(db: AsyncSession, staged: StagedBlob) -> str:
+    """
+    Takes a reference on the blob for `staged`, creating its row on first use,
+    and returns the path the blob is stored under.
+    """
+    await _lock_attachment(db, staged.sha256)
+    stmt = (
+        pg_insert(Attachment)
+        .values(
+            sha256=staged.sha256,
+            path=attachment_store.blob_path(staged),
+            size=staged.size,
+            ref_count=1,
+        )
+        .on_conflict_do_update(
+            index_elements=[Attachment.sha256],
+            set_={"ref_count": Attachment.ref_count + 1},
+        )
+        .returning(Attachment.path)
+    )
+    return await db.scalar(stmt)
+
+
+async def _release_attachment(
+    db: AsyncSession, sha256: str, count: int = 1
+) -> Optional[str]:
+    """
+    Drops `count` references to a blob. Returns its path when those were the
+    last references, in which case the row is deleted and the file may be
+    freed.
+    """
+    await _lock_attachment(db, sha256)
+    row = (
+        await db.execute(
+            update(Attachment)
+            .where(Attachment.sha256 == sha256)
+            .values(ref_count=Attachment.ref_count - count)
+            .returning(Attachment.ref_count, Attachment.path)
+        )
+    ).one_or_none()
+    if row is None or row.ref_count > 0:
+        return None
+    await db.execute(delete(Attachment).where(Attachment.sha256 == sha256))
+    return row.path
+
+
+async def _remove_attachment_file(
+    db: AsyncSession, sha256: Optional[str], path: str, issue_id: int
+) -> None:
+    try:
+        if sha256:
+            # Held until the file is gone: an upload of the same content waits
+            # here, and one that committed first has re-created the row
+            await _lock_attachment(db, sha256)
+            if await db.get(Attachment, sha256, populate_existing=True):
+                return
+        await attachment_store.delete(path)
+        logger.info({"event": "file_deleted", "file_path": path, "issue_id": issue_id})
+    except Exception as e:
+        logger.error(
+            {
+                "event": "file_delete_error",
+                "file_path": path,
+                "issue_id": issue_id,
+                "error": str(e),
+            }
+        )
+    finally:
+        # Nothing was written; ending the transaction releases the lock
+        await db.rollback()
+
+
 @router.delete("/{issue_id}")
 async def delete_issue(
     issue_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(require_role(["ADMIN"])),
 ):
-    issue = db.query(Issue).get(issue_id)
+    issue = await db.get(Issue, issue_id)
     if not issue:
         logger.warning(
             {
@@ -282,46 +1068,208 @@ async def delete_issue(
         )
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    # Delete attached file if it exists
-    if issue.file_path:
-        try:
-            os.remove(issue.file_path)
+    await db.delete(issue)
+    try:
+        await db.flush()
+    except StaleDataError:
+        _raise_issue_conflict(issue_id, user)
+
+    # Attachments shared with other issues stay; legacy uploads are per issue
+    file_to_remove = issue.file_path
+    if issue.attachment_sha256:
+        file_to_remove = await _release_attachment(db, issue.attachment_sha256)
+
+    # --- SSE: Delivered to every process once the delete commits ---
+    await notify_issue_event(db, f"Issue deleted: {issue.title} (id={issue.id})")
+    await apply_issue_deltas(db, issue_deltas(old=counted_state(issue)))
+    await db.commit()
+
+    logger.info({"event": "issue_deleted", "issue_id": issue_id, "user_id": user.id})
+
+    if file_to_remove:
+        await _remove_attachment_file(
+            db, issue.attachment_sha256, file_to_remove, issue_id
+        )
+
+    return {"detail": "Deleted"}
+
+
+@router.post("/bulk", response_model=IssueBulkResult)
+async def bulk_issues(
+    payload: IssueBulkOperation,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user),
+):
+    """
+    Changes the status/severity of, or deletes, a batch of issues with one
+    set-based statement and one commit, and sends a single SSE event for the
+    whole batch. Permissions match the single-issue routes.
+    """
+    ids = sorted(set(payload.ids))
+    logger.info(
+        {
+            "event": "issue_bulk_requested",
+            "action": payload.action,
+            "count": len(ids),
+            "user_id": user.id,
+        }
+    )
+
+    if payload.action == "delete":
+        if user.role.value != UserRole.ADMIN.value:
+            raise HTTPException(status_code=403, detail="Forbidden")
+        affected = await _bulk_delete(db, ids, user)
+    else:
+        affected = await _bulk_update(db, ids, payload, user)
+
+    return IssueBulkResult(action=payload.action, ids=affected)
+
+
+async def _lock_issues(db: AsyncSession, ids: List[int]) -> list:
+    """
+    Locks the existing issues among `ids` in id order, returning their id,
+    status and severity. A bare `id IN (...)` locks rows in whatever order
+    the plan visits them, so two bulk operations over overlapping ids could
+    deadlock.
+    """
+    return (
+        await db.execute(
+            select(Issue.id, Issue.status, Issue.severity)
+            .where(Issue.id.in_(ids))
+            .order_by(Issue.id)
+            .with_for_update()
+        )
+    ).all()
+
+
+async def _bulk_update(
+    db: AsyncSession, ids: List[int], payload: IssueBulkOperation, user
+) -> List[int]:
+    values = {}
+    # Only MAINTAINER and ADMIN can update status/severity
+    for field in ("status", "severity"):
+        value = getattr(payload, field)
+        if value is None:
+            continue
+        if user.role.value not in ("MAINTAINER", "ADMIN"):
             logger.info(
                 {
-                    "event": "file_deleted",
-                    "file_path": issue.file_path,
-                    "issue_id": issue_id,
+                    "event": f"issue_update_forbidden_{field}",
+                    "issue_ids": ids,
+                    "user_id": user.id,
+                    "role": user.role,
                 }
             )
-        except FileNotFoundError:
-            logger.warning(
+        values[field] = value
+    if not values:
+        raise HTTPException(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Nothing to update: set status and/or severity.",
+        )
+
+    # Lock the rows and capture their previous state for the stats counters
+    previous = await _lock_issues(db, ids)
+    rows = (
+        await db.execute(
+            update(Issue)
+            .where(Issue.id.in_([row.id for row in previous]))
+            .values(**values, version=Issue.version + 1)
+            .returning(Issue.id, Issue.status, Issue.severity)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+
+    affected = sorted(row.id for row in rows)
+    if affected:
+        # --- SSE: One event for the whole batch, delivered on commit ---
+        await notify_issue_event(
+            db, f"Issues updated: {len(affected)} issues (ids={affected})"
+        )
+
+    current = {row.id: row for row in rows}
+    await apply_issue_deltas(
+        db,
+        sum_deltas(
+            issue_deltas(
+                {"status": row.status.value, "severity": row.severity.value},
                 {
-                    "event": "file_not_found_on_delete",
-                    "file_path": issue.file_path,
-                    "issue_id": issue_id,
-                }
+                    "status": current[row.id].status.value,
+                    "severity": current[row.id].severity.value,
+                },
             )
-        except Exception as e:
-            logger.error(
-                {
-                    "event": "file_delete_error",
-                    "file_path": issue.file_path,
-                    "issue_id": issue_id,
-                    "error": str(e),
-                }
+            for row in previous
+        ),
+    )
+    await db.commit()
+
+    logger.info(
+        {
+            "event": "issue_bulk_updated",
+            "issue_ids": affected,
+            "updated_fields": payload.model_dump(
+                include={"status", "severity"}, exclude_none=True
+            ),
+            "user_id": user.id,
+        }
+    )
+    return affected
+
+
+async def _bulk_delete(db: AsyncSession, ids: List[int], user) -> List[int]:
+    locked = await _lock_issues(db, ids)
+    rows = (
+        await db.execute(
+            delete(Issue)
+            .where(Issue.id.in_([row.id for row in locked]))
+            .returning(
+                Issue.id,
+                Issue.status,
+                Issue.severity,
+                Issue.file_path,
+                Issue.attachment_sha256,
             )
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
 
-    db.delete(issue)
-    db.commit()
+    # Attachments shared with other issues stay; legacy uploads are per issue
+    references = {}
+    files_to_remove = []
+    for row in rows:
+        if row.attachment_sha256:
+            references[row.attachment_sha256] = (
+                references.get(row.attachment_sha256, 0) + 1
+            )
+        elif row.file_path:
+            files_to_remove.append((None, row.file_path, row.id))
+    for sha256 in sorted(references):
+        path = await _release_attachment(db, sha256, references[sha256])
+        if path:
+            files_to_remove.append((sha256, path, None))
 
-    logger.info({"event": "issue_deleted", "issue_id": issue_id, "user_id": user.id})
+    affected = sorted(row.id for row in rows)
+    if affected:
+        # --- SSE: One event for the whole batch, delivered on commit ---
+        await notify_issue_event(
+            db, f"Issues deleted: {len(affected)} issues (ids={affected})"
+        )
 
-    # --- SSE: Notify connected clients ---
-    for client_queue in connected_clients:
-        try:
-            await client_queue.put(f"Issue deleted: {issue.title} (id={issue.id})")
-        except Exception as e:
-            logger.error(f"Failed to send SSE message to client: {e}")
-    # --- End SSE notification ---
+    await apply_issue_deltas(
+        db,
+        sum_deltas(
+            issue_deltas(
+                old={"status": row.status.value, "severity": row.severity.value}
+            )
+            for row in rows
+        ),
+    )
+    await db.commit()
 
-    return {"detail": "Deleted"}
+    logger.info(
+        {"event": "issue_bulk_deleted", "issue_ids": affected, "user_id": user.id}
+    )
+
+    for sha256, path, issue_id in files_to_remove:
+        await _remove_attachment_file(db, sha256, path, issue_id)
+
+    return affected
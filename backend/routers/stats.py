@@ -1,27 +1,72 @@
-from fastapi import APIRouter, Depends, Query
+import hashlib
+from fastapi import APIRouter, Depends, Header, Query, Response, status as http_status
 from loguru import logger
+from pydantic import TypeAdapter
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Callable, Hashable, List, Literal, Optional
 from datetime import date
 
+from core.cache import TTLCache
+from core.config import STATS_CACHE_MAX_SIZE, STATS_CACHE_TTL_SECONDS
+from core.responses import etag_matches
+from core.stats import bucket_start, current_counts
 from db import get_db
-from dependencies import require_role
+from dependencies import get_current_user, require_role
 from models.daily_stats import DailyStats
-from schemas.stats import DailyStatsOut  # You'll need to define this schema
+from models.issue import Issue
+from models.user import UserRole
+from models.stats_rollup import StatsRollup
+from schemas.stats import DailyStatsOut, IssueCountOut, StatsRollupOut
 
 router = APIRouter()
 
+# Serialized responses keyed by route and filters; cleared on every issue or
+# stats change (see main.py), the TTL only bounds a missed notification
+stats_cache = TTLCache(max_size=STATS_CACHE_MAX_SIZE, ttl=STATS_CACHE_TTL_SECONDS)
+
+_daily_stats_adapter = TypeAdapter(List[DailyStatsOut])
+_rollups_adapter = TypeAdapter(List[StatsRollupOut])
+_counts_adapter = TypeAdapter(List[IssueCountOut])
+
+
+def _cached_json(
+    key: Hashable,
+    if_none_match: Optional[str],
+    adapter: TypeAdapter,
+    load: Callable[[], list],
+) -> Response:
+    """
+    Serves `key` from the cache, calling `load` on a miss, with an ETag over
+    the body so unchanged polls get a 304.
+    """
+    cached = stats_cache.get(key)
+    if cached is None:
+        generation = stats_cache.generation
+        body = adapter.dump_json(adapter.validate_python(load(), from_attributes=True))
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        cached = (etag, body)
+        stats_cache.set(key, cached, generation=generation)
+
+    etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
 
 @router.get("/daily", response_model=List[DailyStatsOut])
 def get_daily_stats(
     status: Optional[str] = Query(None),
     stat_date: Optional[date] = Query(None, alias="date"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     _=Depends(require_role(["ADMIN"])),
 ):
     """
     Fetch daily stats. Supports optional filtering by status and/or date.
-    Logs query parameters and result count.
+    Logs query parameters and result count. Responses are served from memory
+    until stats change, and carry an ETag for conditional polling.
     """
     logger.info(
         {
@@ -30,21 +75,120 @@ def get_daily_stats(
         }
     )
 
-    query = db.query(DailyStats)
+    def load():
+        query = db.query(DailyStats)
+
+        if status:
+            query = query.filter(DailyStats.status == status)
+        if stat_date:
+            query = query.filter(DailyStats.date == stat_date)
+
+        stats = query.order_by(DailyStats.date.desc()).all()
 
-    if status:
-        query = query.filter(DailyStats.status == status)
-    if stat_date:
-        query = query.filter(DailyStats.date == stat_date)
+        logger.info(
+            {
+                "event": "get_daily_stats_success",
+                "count": len(stats),
+                "filters": {"status": status, "date": stat_date},
+            }
+        )
+        return stats
+
+    return _cached_json(
+        ("daily", status, stat_date), if_none_match, _daily_stats_adapter, load
+    )
 
-    stats = query.order_by(DailyStats.date.desc()).all()
 
+@router.get("/rollups", response_model=List[StatsRollupOut])
+def get_stats_rollups(
+    period: Literal["day", "week", "month"] = Query("week"),
+    dimension: Literal["status", "severity"] = Query("status"),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    _=Depends(require_role(["ADMIN"])),
+):
+    """
+    Fetch precomputed per-status or per-severity counts for each day, week
+    or month bucket between `start` and `end`, oldest first. Cached and
+    ETag-aware like /daily.
+    """
     logger.info(
         {
-            "event": "get_daily_stats_success",
-            "count": len(stats),
-            "filters": {"status": status, "date": stat_date},
+            "event": "get_stats_rollups_request",
+            "filters": {
+                "period": period,
+                "dimension": dimension,
+                "start": start,
+                "end": end,
+            },
         }
     )
 
-    return stats
+    def load():
+        query = db.query(StatsRollup).filter(
+            StatsRollup.period == period, StatsRollup.dimension == dimension
+        )
+        if start:
+            # Include the bucket that `start` falls in
+            query = query.filter(StatsRollup.bucket >= bucket_start(period, start))
+        if end:
+            query = query.filter(StatsRollup.bucket <= end)
+
+        rollups = query.order_by(StatsRollup.bucket, StatsRollup.value).all()
+
+        logger.info({"event": "get_stats_rollups_success", "count": len(rollups)})
+
+        return rollups
+
+    return _cached_json(
+        ("rollups", period, dimension, start, end),
+        if_none_match,
+        _rollups_adapter,
+        load,
+    )
+
+
+@router.get("/counts", response_model=List[IssueCountOut])
+def get_issue_counts(
+    dimension: Literal["status", "severity"] = Query("severity"),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """
+    Current number of issues per status or severity, over the issues the
+    caller can list. Maintainers and admins read the running counters, so the
+    cost does not grow with the issue table; reporters get their own issues
+    counted. Cached and ETag-aware like /daily.
+    """
+    logger.info(
+        {
+            "event": "get_issue_counts_request",
+            "user_id": user.id,
+            "dimension": dimension,
+        }
+    )
+
+    if user.role.value == UserRole.REPORTER.value:
+        column = getattr(Issue, dimension)
+        rows = (
+            db.query(column, func.count())
+            .filter(Issue.reporter_id == user.id)
+            .group_by(column)
+            .order_by(column)
+            .all()
+        )
+        counts = [{"value": value.value, "count": count} for value, count in rows]
+        return Response(
+            _counts_adapter.dump_json(_counts_adapter.validate_python(counts)),
+            media_type="application/json",
+            headers={"Cache-Control": "private, no-cache"},
+        )
+
+    def load():
+        counts = current_counts(db, dimension)
+        return [{"value": value, "count": count} for value, count in counts.items()]
+
+    return _cached_json(("counts", dimension), if_none_match, _counts_adapter, load)
@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
 
-from db import get_db
+from db import get_async_db, get_db
 from models.user import User, UserOut, UserRole
-from core.security import hash_password
-from dependencies import require_role
+from core.pubsub import notify_user_changed
+from core.security import hash_password_async
+from dependencies import invalidate_user, require_role
 from core.logging import logger
 
 router = APIRouter()
@@ -24,70 +27,74 @@ class UpdateUserRequest(BaseModel):
 
 
 @router.post("/", response_model=UserOut)
-def create_user(
+async def create_user(
     payload: CreateUserRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(require_role(["ADMIN"])),
 ):
     logger.info(
         {"event": "create_user_attempt", "admin_id": user.id, "email": payload.email}
     )
 
-    existing = db.query(User).filter_by(email=payload.email).first()
+    existing = await db.scalar(select(User).filter_by(email=payload.email))
     if existing:
         logger.warning({"event": "create_user_conflict", "email": payload.email})
         raise HTTPException(status_code=400, detail="Email already exists")
 
     new_user = User(
         email=payload.email,
-        password_hash=hash_password(payload.password),
+        password_hash=await hash_password_async(payload.password),
         role=payload.role,
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
 
     logger.info({"event": "create_user_success", "user_id": new_user.id})
     return UserOut.model_validate(new_user)
 
 
 @router.put("/{user_id}", response_model=UserOut)
-def update_user(
+async def update_user(
     user_id: int,
     payload: UpdateUserRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _=Depends(require_role(["ADMIN"])),
 ):
-    target_user = db.query(User).get(user_id)
+    target_user = await db.get(User, user_id)
     if not target_user:
         logger.warning({"event": "update_user_not_found", "user_id": user_id})
         raise HTTPException(status_code=404, detail="User not found")
 
     if payload.password:
-        target_user.password_hash = hash_password(payload.password)
+        target_user.password_hash = await hash_password_async(payload.password)
     if payload.role:
         target_user.role = payload.role
 
-    db.commit()
-    db.refresh(target_user)
+    # Other processes drop their cached sessions of the user on commit
+    await notify_user_changed(db, user_id)
+    await db.commit()
+    invalidate_user(user_id)
 
     logger.info({"event": "update_user_success", "user_id": user_id})
     return UserOut.model_validate(target_user)
 
 
 @router.delete("/{user_id}")
-def delete_user(
+async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _=Depends(require_role(["ADMIN"])),
 ):
-    target_user = db.query(User).get(user_id)
+    target_user = await db.get(User, user_id)
     if not target_user:
         logger.warning({"event": "delete_user_not_found", "user_id": user_id})
         raise HTTPException(status_code=404, detail="User not found")
 
-    db.delete(target_user)
-    db.commit()
+    await db.delete(target_user)
+    # Other processes drop their cached sessions of the user on commit
+    await notify_user_changed(db, user_id)
+    await db.commit()
+    invalidate_user(user_id)
 
     logger.info({"event": "delete_user_success", "user_id": user_id})
     return {"detail": f"User {user_id} deleted successfully"}
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Literal, Optional
 
 from models.user import UserOut
 
@@ -36,12 +37,99 @@ class IssueUpdate(BaseModel):
     severity: Optional[Severity] = None
 
 
+# Bounded so a batch stays one reasonable statement and one SSE payload
+MAX_BULK_ISSUES = 500
+
+
+class IssueBulkOperation(BaseModel):
+    action: Literal["update", "delete"]
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ISSUES)
+    # Only used by "update"
+    status: Optional[Status] = None
+    severity: Optional[Severity] = None
+
+
+class IssueBulkResult(BaseModel):
+    action: str
+    # The issues that existed and were changed
+    ids: List[int]
+
+
+# Range of the Postgres integer columns user ids are stored in
+INT4_MIN, INT4_MAX = -(2**31), 2**31 - 1
+
+
+class IssueImportRow(BaseModel):
+    """One imported issue; accepts the columns written by /export."""
+
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str
+    severity: Severity = Severity.LOW
+    status: Status = Status.OPEN
+    reporter_id: Optional[int] = Field(None, ge=INT4_MIN, le=INT4_MAX)
+    reporter_email: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_validator("title", "description", "reporter_email")
+    @classmethod
+    def _no_nul(cls, value: Optional[str]) -> Optional[str]:
+        # Postgres text cannot store NUL; reject the row instead of the COPY
+        if value is not None and "\x00" in value:
+            raise ValueError("must not contain NUL characters")
+        return value
+
+
+class IssueImportError(BaseModel):
+    line: int
+    error: str
+
+
+class IssueImportResult(BaseModel):
+    imported: int
+    failed: int
+    # The first failures only; `failed` counts all of them
+    errors: List[IssueImportError]
+
+
+class IssueSearchResult(BaseModel):
+    id: int
+    title: str
+    status: Status
+    severity: Severity
+    rank: float
+    # HTML-escaped text with matched terms wrapped in <b></b>; safe to render
+    # as HTML. `title` is the raw, unescaped title.
+    title_highlight: str
+    snippet: str
+
+    class Config:
+        from_attributes = True
+
+
 class IssueOut(IssueBase):
     id: int
     status: Status
     severity: Severity = Severity.LOW
     file_path: Optional[str]
+    file_name: Optional[str] = None
     reporter: Optional[UserOut]
+    version: int = 1
 
     class Config:
         from_attributes = True
+
+
+class IssueSummary(BaseModel):
+    """
+    List-view projection of an issue. Built straight from selected columns,
+    so it is documentation for the /summary payload rather than a validator.
+    """
+
+    id: int
+    title: str
+    status: Status
+    severity: Severity
+    reporter_email: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
@@ -9,4 +9,20 @@ class DailyStatsOut(BaseModel):
     count: int
 
     class Config:
-        orm_mode = True
+        from_attributes = True
+
+
+class StatsRollupOut(BaseModel):
+    period: str
+    dimension: str
+    bucket: date
+    value: str
+    count: int
+
+    class Config:
+        from_attributes = True
+
+
+class IssueCountOut(BaseModel):
+    value: str
+    count: int
@@ -11,6 +11,7 @@ interface TApiSuccess<T> {
   success: true;
   status: 200;
   data: T;
+  headers?: Record<string, string>;
 }
 
 interface TApiFailure {
@@ -172,7 +173,12 @@ async function get<TResponse, TRequestParams>(
         Authorization: options.Authorization,
       },
     });
-    return { success: true, status: 200, data: response.data };
+    return {
+      success: true,
+      status: 200,
+      data: response.data,
+      headers: response.headers as Record<string, string>,
+    };
   } catch (error) {
     return requestFailureCallback(error);
   }
@@ -185,6 +191,7 @@ async function put<TRequest, TResponse, TRequestParams>(
     params?: TRequestParams;
     withCredentials?: boolean;
     Authorization?: string;
+    ifMatch?: string;
     contentType?:
       | "application/json"
       | "multipart/form-data"
@@ -201,6 +208,7 @@ async function put<TRequest, TResponse, TRequestParams>(
       headers: {
         "Content-Type": options.contentType,
         Authorization: options.Authorization,
+        "If-Match": options.ifMatch,
       },
     });
     return { success: true, status: 200, data: response.data };
@@ -7,6 +7,7 @@ const Urls = {
   createIssue: "/api/issues/",
   updateIssue: "/api/issues/$$issue_id$$",
   deleteIssue: "/api/issues/$$issue_id$$",
+  issueAttachment: "/api/issues/$$issue_id$$/attachment",
 
   getUsers: "/users/",
   createUser: "/users/",
@@ -14,6 +15,7 @@ const Urls = {
   deleteUser: "/users/$$user_id$$",
 
   getDailyStats: "/stats/daily",
+  getIssueCounts: "/stats/counts",
 } as const;
 
 export default Urls;
@@ -7,7 +7,9 @@ interface TIssue {
   id: number;
   status: "OPEN" | "TRIAGED" | "IN_PROGRESS" | "DONE";
   file_path: string | null;
+  file_name: string | null;
   reporter: TUser | null;
+  version: number;
 }
 
 export type { TIssue };
@@ -7,4 +7,10 @@ interface TStat {
   count: number;
 }
 
-export type { TStat };
+// Current number of issues with one status or severity value
+interface TIssueCount {
+  value: string;
+  count: number;
+}
+
+export type { TStat, TIssueCount };
@@ -3,6 +3,9 @@ import { delete_, get, post, put } from "$lib/api/config";
 import Urls from "$lib/api/urls";
 import type { TIssue } from "$lib/types/issue";
 
+// Rows per dashboard page; further pages are loaded on demand
+const ISSUES_PAGE_SIZE = 100;
+
 interface TUpdateIssueRequest {
   title: string;
   description: string;
@@ -10,18 +13,32 @@ interface TUpdateIssueRequest {
   status: TIssue["status"];
 }
 
-export const GET: RequestHandler = async ({ locals }) => {
+export const GET: RequestHandler = async ({ locals, url }) => {
   const token = locals.token;
 
   if (!token) {
     return json({ error: "Unauthorized" }, { status: 401 });
   }
 
-  const response = await get<TIssue[], "">(Urls.getIssues, {
-    Authorization: `Bearer ${token}`,
+  // One page per call; pass the returned cursor back to get the next one
+  const cursor = url.searchParams.get("cursor");
+  const response = await get<TIssue[], { limit: number; cursor?: string }>(
+    Urls.getIssues,
+    {
+      params: { limit: ISSUES_PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+      Authorization: `Bearer ${token}`,
+    },
+  );
+  if (!response.success) return json(response);
+
+  return json({
+    success: true,
+    status: 200,
+    data: {
+      issues: response.data,
+      nextCursor: response.headers?.["x-next-cursor"] ?? null,
+    },
   });
-
-  return json(response);
 };
 
 export const POST: RequestHandler = async ({ request, locals }) => {
@@ -62,7 +79,8 @@ export const POST: RequestHandler = async ({ request, locals }) => {
 };
 
 export const PUT: RequestHandler = async ({ request, locals }) => {
-  const { title, description, severity, status, id } = await request.json();
+  const { title, description, severity, status, id, version } =
+    await request.json();
   const token = locals.token;
 
   if (!token) {
@@ -79,6 +97,8 @@ export const PUT: RequestHandler = async ({ request, locals }) => {
     },
     {
       Authorization: `Bearer ${token}`,
+      // Rejected with 412 if someone else saved the issue in the meantime
+      ifMatch: version ? `"${version}"` : undefined,
     },
   );
 
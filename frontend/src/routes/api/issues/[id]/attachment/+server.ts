@@ -0,0 +1,53 @@
+import { json, type RequestHandler } from "@sveltejs/kit";
+import { env } from "$env/dynamic/public";
+import Urls from "$lib/api/urls";
+
+// Request headers the browser may send for a conditional or partial download
+const FORWARDED_REQUEST_HEADERS = ["if-none-match", "range"];
+
+// Backend headers the browser needs, including the ones that keep uploaded
+// files from rendering as active content
+const FORWARDED_RESPONSE_HEADERS = [
+  "content-type",
+  "content-disposition",
+  "content-range",
+  "accept-ranges",
+  "cache-control",
+  "etag",
+  "last-modified",
+  "x-content-type-options",
+  "content-security-policy",
+];
+
+// Streams the attachment through this server so the bearer token stays in the
+// cookie and never ends up in a URL the browser navigates to
+export const GET: RequestHandler = async ({ params, request, locals }) => {
+  const token = locals.token;
+
+  if (!token) {
+    return json({ error: "Unauthorized" }, { status: 401 });
+  }
+
+  const headers = new Headers({ Authorization: `Bearer ${token}` });
+  for (const name of FORWARDED_REQUEST_HEADERS) {
+    const value = request.headers.get(name);
+    if (value) headers.set(name, value);
+  }
+
+  const response = await fetch(
+    env.PUBLIC_API_URL +
+      Urls.issueAttachment.replace("$$issue_id$$", params.id ?? ""),
+    { headers },
+  );
+
+  const responseHeaders = new Headers();
+  for (const name of FORWARDED_RESPONSE_HEADERS) {
+    const value = response.headers.get(name);
+    if (value) responseHeaders.set(name, value);
+  }
+
+  return new Response(response.body, {
+    status: response.status,
+    headers: responseHeaders,
+  });
+};
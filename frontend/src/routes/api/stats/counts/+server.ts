@@ -0,0 +1,22 @@
+import { json, type RequestHandler } from "@sveltejs/kit";
+import { get } from "$lib/api/config";
+import Urls from "$lib/api/urls";
+import type { TIssueCount } from "$lib/types/stat";
+
+export const GET: RequestHandler = async ({ locals, url }) => {
+  const token = locals.token;
+
+  if (!token) {
+    return json({ error: "Unauthorized" }, { status: 401 });
+  }
+
+  const response = await get<TIssueCount[], { dimension: string }>(
+    Urls.getIssueCounts,
+    {
+      params: { dimension: url.searchParams.get("dimension") ?? "severity" },
+      Authorization: `Bearer ${token}`,
+    },
+  );
+
+  return json(response);
+};